@@ -1,5 +1,16 @@
 # asset_database.py
-ASSET_DATABASE = {
+import importlib.util
+import sys
+import types
+from collections import defaultdict
+from functools import lru_cache
+import numpy as np
+
+# numba ist optional; importiert wird es erst beim ersten grossen Portfolio,
+# damit z.B. die GUI (braucht nur PORTFOLIO_STRATEGIES) schnell startet
+_NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+_RAW_ASSET_DATABASE = {
     # Stocks & Equity ETFs
     "SPY": {"name": "SPDR S&P 500 ETF", "type": "US Large Cap Stocks", "category": "Equity"},
     "QQQ": {"name": "Invesco QQQ Trust", "type": "US Growth Stocks", "category": "Equity"},
@@ -38,6 +49,16 @@ ASSET_DATABASE = {
     "NVDA": {"name": "NVIDIA Corporation", "type": "Technology", "category": "Equity"},
 }
 
+# Schreibgeschützte Sicht mit internierten Kategorie-/Typ-Strings
+ASSET_DATABASE = types.MappingProxyType({
+    symbol: types.MappingProxyType({
+        "name": info["name"],
+        "type": sys.intern(info["type"]),
+        "category": sys.intern(info["category"]),
+    })
+    for symbol, info in _RAW_ASSET_DATABASE.items()
+})
+
 PORTFOLIO_STRATEGIES = {
     "All Weather (Ray Dalio)": {
         "description": "Designed to perform well in all economic environments",
@@ -85,15 +106,80 @@ PORTFOLIO_STRATEGIES = {
     }
 }
 
+# Ticker -> Kategorie, einmalig beim Import berechnet
+_TICKER_TO_CATEGORY = {k: v["category"] for k, v in ASSET_DATABASE.items()}
+
+@lru_cache(maxsize=1)
+def _asset_table():
+    """Spaltenorientierte Sicht (Struct of Arrays) für Abfragen über viele Ticker, beim ersten Bedarf gebaut"""
+    import pandas as pd   # Lazy import: nur für den vektorisierten Pfad nötig
+    return pd.DataFrame.from_dict(_RAW_ASSET_DATABASE, orient="index")
+
+def __getattr__(name):
+    # ASSET_TABLE bleibt als Modulattribut erreichbar, wird aber erst beim Zugriff gebaut
+    if name == "ASSET_TABLE":
+        return _asset_table()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+@lru_cache(maxsize=1024)
 def get_asset_info(ticker):
     """Get asset information from database"""
-    return ASSET_DATABASE.get(ticker, {"name": ticker, "type": "Unknown", "category": "Unknown"})
+    info = ASSET_DATABASE.get(ticker)
+    if info is None:
+        # Gecachter Eintrag wird geteilt, daher ebenfalls schreibgeschützt
+        info = types.MappingProxyType({"name": ticker, "type": "Unknown", "category": "Unknown"})
+    return info
+
+# Ab dieser Grösse lohnt sich der vektorisierte Pfad
+_VECTORIZE_THRESHOLD = 64
+# Ab dieser Grösse lohnt sich der JIT-Kernel (Kompilierzeit beim ersten Aufruf)
+_JIT_THRESHOLD = 10_000
+
+# Ganzzahlige Kategorie-Codes für den Numba-Kernel
+_CATEGORIES = sorted(set(_TICKER_TO_CATEGORY.values()) | {"Unknown"})
+_CATEGORY_CODE = {c: i for i, c in enumerate(_CATEGORIES)}
+_UNKNOWN_CODE = _CATEGORY_CODE["Unknown"]
+_TICKER_CODE = {t: _CATEGORY_CODE[c] for t, c in _TICKER_TO_CATEGORY.items()}
 
 def get_portfolio_allocation(portfolio_tickers, portfolio_weights):
     """Calculate allocation by asset category"""
-    allocation = {}
+    if _NUMBA_AVAILABLE and len(portfolio_tickers) >= _JIT_THRESHOLD:
+        return _get_portfolio_allocation_jit(portfolio_tickers, portfolio_weights)
+    if len(portfolio_tickers) >= _VECTORIZE_THRESHOLD:
+        return get_portfolio_allocation_bulk(portfolio_tickers, portfolio_weights)
+
+    allocation = defaultdict(float)
+    get_category = _TICKER_TO_CATEGORY.get
     for ticker, weight in zip(portfolio_tickers, portfolio_weights):
-        asset_info = get_asset_info(ticker)
-        category = asset_info["category"]
-        allocation[category] = allocation.get(category, 0) + weight
-    return allocation
\ No newline at end of file
+        allocation[get_category(ticker, "Unknown")] += weight
+    return dict(allocation)
+
+def get_portfolio_allocation_bulk(portfolio_tickers, portfolio_weights):
+    """Calculate allocation by asset category for large portfolios (vectorized groupby)"""
+    import pandas as pd
+    categories = _asset_table()["category"].reindex(list(portfolio_tickers)).fillna("Unknown").to_numpy()
+    weights = pd.Series(np.asarray(portfolio_weights, dtype=np.float64))
+    return weights.groupby(categories).sum().to_dict()
+
+def _sum_by_code(codes, weights, n_categories):
+    """Grouped sum of weights by integer category code"""
+    out = np.zeros(n_categories)
+    for i in range(codes.size):
+        out[codes[i]] += weights[i]
+    return out
+
+@lru_cache(maxsize=1)
+def _sum_by_code_jit():
+    """Kompilierter _sum_by_code; numba wird erst hier importiert"""
+    from numba import njit
+    return njit(cache=True)(_sum_by_code)
+
+def _get_portfolio_allocation_jit(portfolio_tickers, portfolio_weights):
+    """Calculate allocation by asset category with the compiled kernel"""
+    get_code = _TICKER_CODE.get
+    codes = np.fromiter((get_code(t, _UNKNOWN_CODE) for t in portfolio_tickers),
+                        dtype=np.int8, count=len(portfolio_tickers))
+    weights = np.asarray(portfolio_weights, dtype=np.float64)
+    sums = _sum_by_code_jit()(codes, weights, len(_CATEGORIES))
+    present = np.bincount(codes, minlength=len(_CATEGORIES)) > 0
+    return {_CATEGORIES[i]: float(sums[i]) for i in np.flatnonzero(present)}
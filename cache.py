@@ -0,0 +1,82 @@
+# cache.py
+import importlib.util
+import json
+import os
+import pickle
+from datetime import datetime, timezone
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".pynance", "cache")
+DEFAULT_TTL = 24 * 60 * 60  # Sekunden (1 Tag)
+
+
+def _parquet_available():
+    """Parquet needs pyarrow or fastparquet installed"""
+    return any(importlib.util.find_spec(m) is not None for m in ("pyarrow", "fastparquet"))
+
+
+class FileCache:
+    """
+    Simple file-backed cache for downloaded market data.
+    Each entry is a data file plus a JSON sidecar with the UTC timestamp.
+
+    Parameters:
+    - directory: where the cache files are stored
+    - ttl: maximum age of an entry in seconds
+    - fmt: "pickle" for arbitrary objects, "parquet" for DataFrames
+           (falls back to pickle if no parquet engine is installed)
+    """
+
+    def __init__(self, directory=CACHE_DIR, ttl=DEFAULT_TTL, fmt="pickle"):
+        self.directory = directory
+        self.ttl = ttl
+        self.fmt = "parquet" if fmt == "parquet" and _parquet_available() else "pickle"
+
+    def _paths(self, key):
+        base = os.path.join(self.directory, key)
+        ext = ".parquet" if self.fmt == "parquet" else ".pkl"
+        return base + ext, base + ".json"
+
+    def get(self, key):
+        """Return the cached object or None if missing / expired"""
+        data_path, meta_path = self._paths(key)
+        if not (os.path.exists(data_path) and os.path.exists(meta_path)):
+            return None
+
+        try:
+            with open(meta_path, "r") as f:
+                ts = json.load(f)["timestamp"]
+            age = datetime.now(timezone.utc).timestamp() - ts
+            if age >= self.ttl:
+                return None
+
+            if self.fmt == "parquet":
+                import pandas as pd
+                return pd.read_parquet(data_path)
+
+            with open(data_path, "rb") as f:
+                return pickle.load(f)
+        except (OSError, ValueError, KeyError, pickle.UnpicklingError):
+            return None
+
+    def set(self, key, value):
+        """Store an object in the cache"""
+        os.makedirs(self.directory, exist_ok=True)   # erst beim Schreiben anlegen, nicht beim Import
+        data_path, meta_path = self._paths(key)
+        if self.fmt == "parquet":
+            value.to_parquet(data_path)
+        else:
+            with open(data_path, "wb") as f:
+                pickle.dump(value, f)
+        with open(meta_path, "w") as f:
+            json.dump({"timestamp": datetime.now(timezone.utc).timestamp()}, f)
+
+    def clear(self):
+        """Delete all entries in the cache directory"""
+        removed = 0
+        if not os.path.isdir(self.directory):
+            return removed
+        for name in os.listdir(self.directory):
+            if name.endswith((".pkl", ".parquet", ".json")):
+                os.remove(os.path.join(self.directory, name))
+                removed += 1
+        return removed
@@ -1,31 +1,111 @@
 # data_loader.py
-import yfinance as yf
-import pandas as pd
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from cache import FileCache
 
-def load_data(tickers, period="10y"):
+_cache = FileCache(fmt="parquet")   # Kursdaten spaltenorientiert als Parquet
+
+_PRICE_COLUMNS = ['Open', 'High', 'Low', 'Close']
+
+def clear_cache():
+    """Remove all cached downloads (prices and ticker info share the cache directory)"""
+    return _cache.clear()
+
+def load_data(tickers, period="10y", use_cache=True):
     """
     Load historical price data for given tickers
-    
+
     Parameters:
     - tickers: list of ticker symbols
     - period: time period (1d,5d,1mo,3mo,6mo,1y,2y,5y,10y,ytd,max)
+    - use_cache: read from the on-disk cache (fresh downloads are always stored)
     """
     data = {}
-    
+    tickers = list(tickers)
+
+    # Bereits gecachte Ticker nicht erneut herunterladen
+    missing = []
     for t in tickers:
+        cached = _cache.get(f"{t}_{period}") if use_cache else None
+        if cached is not None:
+            data[t] = cached
+        else:
+            missing.append(t)
+
+    if missing:
         try:
-            df = yf.download(t, period=period, auto_adjust=True)
-            if df.empty:
-                print(f"No data found for {t}")
-                continue
-                
-            df = df[['Open', 'High', 'Low', 'Close', 'Volume']]
-            data[t] = df
-            
-            print(f"Loaded {t}: {len(df)} trading days")
-            
+            frames = _download_batch(missing, period)
         except Exception as e:
-            print(f"Error loading {t}: {e}")
-    
-    return data
\ No newline at end of file
+            print(f"Batch download failed ({e}), loading tickers individually...")
+            frames = _download_each(missing, period)
+
+        # Ticker, die in der Sammelantwort fehlen, einzeln nachladen
+        retry = [t for t in missing if t not in frames]
+        if retry:
+            frames.update(_download_each(retry, period))
+
+        for t in missing:
+            try:
+                df = frames.get(t)
+                if isinstance(df, Exception):
+                    raise df
+                if df is None:
+                    print(f"No data found for {t}")
+                    continue
+
+                df = df[_PRICE_COLUMNS + ['Volume']].dropna(how='all')
+                if df.empty:
+                    print(f"No data found for {t}")
+                    continue
+
+                # Kompakte Speicherung: float32-Preise, ganzzahliges Volumen
+                df = df.astype({c: 'float32' for c in _PRICE_COLUMNS})
+                df['Volume'] = df['Volume'].fillna(0).astype('int64')
+
+                data[t] = df
+                _cache.set(f"{t}_{period}", df)
+
+            except Exception as e:
+                print(f"Error loading {t}: {e}")
+
+    # Reihenfolge der Eingabe beibehalten
+    data = {t: data[t] for t in tickers if t in data}
+    for t, df in data.items():
+        print(f"Loaded {t}: {len(df)} trading days")
+
+    return data
+
+
+def _download_batch(tickers, period):
+    """Download all tickers with a single yf.download call (yfinance fetches in parallel)"""
+    import yfinance as yf   # Lazy import: nur nötig, wenn wirklich heruntergeladen wird
+
+    raw = yf.download(tickers, period=period, auto_adjust=True,
+                      group_by='ticker', threads=True, progress=False)
+
+    if raw.columns.nlevels < 2:
+        raise ValueError("unexpected column layout")
+
+    # Fehlgeschlagene Symbole kommen als reine NaN-Spalten zurück -> weglassen, damit sie
+    # einzeln nachgeladen werden
+    available = set(raw.columns.get_level_values(0))
+    return {t: raw[t] for t in tickers
+            if t in available and not raw[t].dropna(how='all').empty}
+
+
+def _download_each(tickers, period):
+    """Fallback: one yf.download per ticker, run concurrently in a thread pool"""
+    import yfinance as yf
+
+    def download_one(t):
+        try:
+            df = yf.download(t, period=period, auto_adjust=True, progress=False)
+        except Exception as e:
+            return t, e
+        if df.empty:
+            return t, None
+        if df.columns.nlevels > 1:
+            df.columns = df.columns.get_level_values(0)
+        return t, df
+
+    with ThreadPoolExecutor(max_workers=min(8, len(tickers))) as ex:
+        return dict(ex.map(download_one, tickers))
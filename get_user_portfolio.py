@@ -1,3 +1,5 @@
+import numpy as np
+
 def get_user_portfolio():
     tickers = input("Enter tickers separated by commas: ").upper().split(",")
     tickers = [t.strip() for t in tickers]
@@ -8,8 +10,11 @@ def get_user_portfolio():
     if len(tickers) != len(weights):
         raise ValueError("Number of weights must match number of tickers.")
 
-    total = sum(weights)
-    weights = [w / total for w in weights]
+    w = np.asarray(weights, dtype=np.float64)
+    total = w.sum()
+    if total <= 0:
+        raise ValueError("Total weight must be positive.")
+    w /= total
 
-    return tickers, weights
+    return tickers, w.tolist()
 
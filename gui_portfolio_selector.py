@@ -1,6 +1,175 @@
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import ttk, messagebox
-import yfinance as yf
+import numpy as np
+from asset_database import PORTFOLIO_STRATEGIES
+from cache import FileCache
+
+
+# Persistenter Cache: Preis kurzlebig (1 h), Name/Sektor langlebig (24 h)
+_price_cache = FileCache(ttl=60 * 60)
+_profile_cache = FileCache(ttl=24 * 60 * 60)
+
+
+def _ticker_info(symbol):
+    """
+    Fetch name, sector and price for a ticker (repeats are served by the disk caches,
+    so the price still expires after its TTL within a running session).
+    Uses the lightweight quote (fast_info) and search endpoints instead of
+    the full Ticker.info fundamentals request.
+    """
+    import yfinance as yf   # Lazy import: yfinance ist beim Start teuer
+
+    price = _price_cache.get(f"price_{symbol}")
+    if price is None:
+        price = yf.Ticker(symbol).fast_info.last_price
+        if price is not None:
+            _price_cache.set(f"price_{symbol}", price)
+
+    profile = _profile_cache.get(f"profile_{symbol}")
+    if profile is None:
+        quotes = yf.Search(symbol, max_results=5, news_count=0).quotes
+        match = next((q for q in quotes if q.get("symbol") == symbol), {})
+        profile = {
+            "longName": match.get("longname") or match.get("shortname") or "Unknown Company",
+            "sector": match.get("sector", "N/A"),
+        }
+        _profile_cache.set(f"profile_{symbol}", profile)
+
+    return {
+        **profile,
+        "currentPrice": price if price is not None else "N/A",
+    }
+
+
+class VirtualListbox(tk.Canvas):
+    """
+    Listbox replacement that only draws the rows currently visible.
+    Items live in a plain Python list; a fixed pool of canvas text items
+    is recycled on scroll, so drawing cost depends on the viewport size
+    and not on the number of rows. Supports the Listbox subset used here
+    (insert, delete, get, size, curselection, yview, yscrollcommand).
+    """
+
+    def __init__(self, master, width=35, height=10, row_height=20, font=('Arial', 10), **kwargs):
+        self._row_height = row_height
+        self._font = font
+        super().__init__(master, width=width * 8, height=height * row_height,
+                         background="white", highlightthickness=1, **kwargs)
+
+        self._items = []
+        self._first = 0                 # Index der obersten sichtbaren Zeile
+        self._selected = None
+        self._text_ids = []             # Wiederverwendete Text-Elemente
+        self._yscrollcommand = None
+        self._selection_rect = self.create_rectangle(0, 0, 0, 0, fill="#cce4f7", outline="", state="hidden")
+
+        self.bind("<Configure>", lambda e: self._redraw())
+        self.bind("<Button-1>", self._on_click)
+        self.bind("<MouseWheel>", lambda e: self.yview("scroll", -1 if e.delta > 0 else 1, "units"))
+        self.bind("<Button-4>", lambda e: self.yview("scroll", -1, "units"))
+        self.bind("<Button-5>", lambda e: self.yview("scroll", 1, "units"))
+
+    def configure(self, cnf=None, **kwargs):
+        if "yscrollcommand" in kwargs:
+            self._yscrollcommand = kwargs.pop("yscrollcommand")
+            self._redraw()
+            if not cnf and not kwargs:
+                return None
+        return super().configure(cnf, **kwargs)
+
+    config = configure
+
+    # ---------- Listbox-API ----------
+
+    def set_items(self, items):
+        """Replace all rows at once"""
+        self._items = list(items)
+        self._selected = None
+        self._first = min(self._first, self._max_first())
+        self._redraw()
+
+    def insert(self, index, *items):
+        if index == tk.END:
+            self._items.extend(items)
+        else:
+            self._items[index:index] = items
+        self._redraw()
+
+    def delete(self, first, last=None):
+        if last == tk.END:
+            last = len(self._items) - 1
+        elif last is None:
+            last = first
+        del self._items[first:last + 1]
+        if self._selected is not None and first <= self._selected <= last:
+            self._selected = None
+        elif self._selected is not None and self._selected > last:
+            self._selected -= last - first + 1
+        self._first = min(self._first, self._max_first())
+        self._redraw()
+
+    def get(self, index):
+        return self._items[index]
+
+    def size(self):
+        return len(self._items)
+
+    def curselection(self):
+        return () if self._selected is None else (self._selected,)
+
+    def yview(self, *args):
+        if not args:
+            return self._fractions()
+        if args[0] == "moveto":
+            self._first = int(float(args[1]) * len(self._items))
+        elif args[0] == "scroll":
+            step = self._visible_rows() if args[2] == "pages" else 1
+            self._first += int(args[1]) * step
+        self._first = max(0, min(self._first, self._max_first()))
+        self._redraw()
+
+    # ---------- Intern ----------
+
+    def _visible_rows(self):
+        return max(1, self.winfo_height() // self._row_height)
+
+    def _max_first(self):
+        return max(0, len(self._items) - self._visible_rows())
+
+    def _fractions(self):
+        if not self._items:
+            return 0.0, 1.0
+        n = len(self._items)
+        return self._first / n, min(1.0, (self._first + self._visible_rows()) / n)
+
+    def _on_click(self, event):
+        idx = self._first + event.y // self._row_height
+        self._selected = idx if idx < len(self._items) else None
+        self._redraw()
+
+    def _redraw(self):
+        n_visible = self._visible_rows() + 1
+        while len(self._text_ids) < n_visible:
+            self._text_ids.append(self.create_text(4, 0, anchor="nw", font=self._font))
+
+        for row, text_id in enumerate(self._text_ids):
+            idx = self._first + row
+            if idx < len(self._items):
+                self.itemconfigure(text_id, text=self._items[idx], state="normal")
+                self.coords(text_id, 4, row * self._row_height + 2)
+            else:
+                self.itemconfigure(text_id, state="hidden")
+
+        if self._selected is not None and self._first <= self._selected < self._first + n_visible:
+            y = (self._selected - self._first) * self._row_height
+            self.coords(self._selection_rect, 0, y, self.winfo_width(), y + self._row_height)
+            self.itemconfigure(self._selection_rect, state="normal")
+        else:
+            self.itemconfigure(self._selection_rect, state="hidden")
+
+        if self._yscrollcommand is not None:
+            self._yscrollcommand(*self._fractions())
 
 
 class PortfolioSelectorGUI:
@@ -16,31 +185,15 @@ class PortfolioSelectorGUI:
 
         self.selected_tickers = []
         self.selected_weights = []
+        self._portfolio_rows = []            # Angezeigte Zeilen der portfolio_list (Python-seitiges Modell)
+        self._unset_weights = 0              # Anzahl Ticker ohne gesetztes Gewicht
+        self._ticker_set = set()             # O(1)-Duplikatprüfung parallel zu selected_tickers
+        self._current_search_ticker = None   # Ticker der letzten erfolgreichen Suche
+        self._pool = ThreadPoolExecutor(max_workers=8)   # yfinance-Abfragen ausserhalb des Tk-Mainloops
 
-        # Predefined portfolios
+        # Predefined portfolios (single source of truth in asset_database)
         self.predefined_portfolios = {
-            "All Weather (Ray Dalio)": {
-                "TLT": 0.40,    
-                "SPY": 0.30,    
-                "IEF": 0.15,    
-                "GLD": 0.075,   
-                "DBC": 0.075,  
-            },
-            "60/40 Portfolio": {
-                "SPY": 0.60,    
-                "AGG": 0.40,    
-            },
-            "Permanent Portfolio": {
-                "SPY": 0.25, 
-                "TLT": 0.25,    
-                "GLD": 0.25,    
-                "SHY": 0.25,    
-            },
-            "Three Fund Portfolio": {
-                "VTI": 0.50,    
-                "VXUS": 0.30,   
-                "BND": 0.20,    
-            }
+            name: strategy["assets"] for name, strategy in PORTFOLIO_STRATEGIES.items()
         }
 
         main_container = ttk.Frame(self.root, padding="10")
@@ -75,7 +228,8 @@ class PortfolioSelectorGUI:
         self.search_entry.pack(side=tk.LEFT, padx=(0, 5))
         self.search_entry.bind('<Return>', lambda e: self.search_ticker())
         
-        ttk.Button(search_frame, text="Search", command=self.search_ticker).pack(side=tk.LEFT, padx=(0, 10))
+        self.search_button = ttk.Button(search_frame, text="Search", command=self.search_ticker)
+        self.search_button.pack(side=tk.LEFT, padx=(0, 10))
         
         quick_frame = ttk.Frame(left_frame)
         quick_frame.pack(fill=tk.X, pady=(0, 10))
@@ -95,7 +249,7 @@ class PortfolioSelectorGUI:
         results_frame = ttk.Frame(left_frame)
         results_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
 
-        self.results_list = tk.Listbox(results_frame, width=35, height=10)
+        self.results_list = VirtualListbox(results_frame, width=35, height=10)
         self.results_list.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
         results_scrollbar = ttk.Scrollbar(results_frame, orient=tk.VERTICAL, command=self.results_list.yview)
@@ -112,7 +266,7 @@ class PortfolioSelectorGUI:
         portfolio_list_frame = ttk.Frame(right_frame)
         portfolio_list_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
 
-        self.portfolio_list = tk.Listbox(portfolio_list_frame, width=40, height=12)
+        self.portfolio_list = VirtualListbox(portfolio_list_frame, width=40, height=12)
         self.portfolio_list.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
         portfolio_scrollbar = ttk.Scrollbar(portfolio_list_frame, orient=tk.VERTICAL, command=self.portfolio_list.yview)
@@ -152,6 +306,7 @@ class PortfolioSelectorGUI:
         asset_label.pack()
 
         self.root.mainloop()
+        self._pool.shutdown(wait=False)
 
     def on_portfolio_select(self, event):
         """When a predefined portfolio is selected from dropdown"""
@@ -172,15 +327,19 @@ class PortfolioSelectorGUI:
         if self.selected_tickers and not messagebox.askyesno("Confirm", "This will replace your current portfolio. Continue?"):
             return
 
-        self.portfolio_list.delete(0, tk.END)
         self.selected_tickers.clear()
         self.selected_weights.clear()
+        self._portfolio_rows.clear()
+        self._ticker_set.clear()
+        self._unset_weights = 0
 
         portfolio = self.predefined_portfolios[portfolio_name]
         for ticker, weight in portfolio.items():
             self.selected_tickers.append(ticker)
+            self._ticker_set.add(ticker)
             self.selected_weights.append(weight)
-            self.portfolio_list.insert(tk.END, f"{ticker} — weight: {weight:.1%}")
+            self._portfolio_rows.append(f"{ticker} — weight: {weight:.1%}")
+        self._refresh_portfolio_list()
 
         messagebox.showinfo("Success", f"Loaded {portfolio_name} portfolio")
 
@@ -192,56 +351,84 @@ class PortfolioSelectorGUI:
 
         equal_weight = 1.0 / len(self.selected_tickers)
         self.selected_weights = [equal_weight] * len(self.selected_tickers)
+        self._unset_weights = 0
         
-        self.portfolio_list.delete(0, tk.END)
-        for i, ticker in enumerate(self.selected_tickers):
-            self.portfolio_list.insert(tk.END, f"{ticker} — weight: {equal_weight:.1%}")
+        self._portfolio_rows = [f"{ticker} — weight: {equal_weight:.1%}" for ticker in self.selected_tickers]
+        self._refresh_portfolio_list()
 
         messagebox.showinfo("Success", f"Balanced portfolio with equal weights")
 
+    def _refresh_portfolio_list(self):
+        """Redraw the portfolio list from _portfolio_rows in one pass"""
+        self.portfolio_list.set_items(self._portfolio_rows)
+        self.root.update_idletasks()
+
     def quick_add_ticker(self, ticker):
         """Quickly add a popular ticker without searching"""
         self.search_entry.delete(0, tk.END)
         self.search_entry.insert(0, ticker)
-        self.search_ticker()
-        self.root.after(100, self.add_ticker)
+        self.search_ticker(on_success=self.add_ticker)
 
-    def search_ticker(self):
+    def search_ticker(self, on_success=None):
         query = self.search_entry.get().upper().strip()
         if not query:
             messagebox.showwarning("Warning", "Please enter a ticker symbol.")
             return
 
+        # Netzwerkabfrage im Hintergrund; Tk wird nur vom Hauptthread aus angefasst
+        self.search_button.state(["disabled"])
+        future = self._pool.submit(_ticker_info, query)
+        self.root.after(50, self._check_search_result, query, future, on_success)
+
+    def _check_search_result(self, query, future, on_success=None):
+        """Poll the pending search from the Tk main loop until it is done"""
+        if not future.done():
+            self.root.after(50, self._check_search_result, query, future, on_success)
+            return
+        self._populate_results(query, future, on_success)
+
+    def _populate_results(self, query, future, on_success=None):
+        """Show the search result (runs on the Tk main thread)"""
+        self.search_button.state(["!disabled"])
         try:
-            ticker = yf.Ticker(query)
-            info = ticker.info
+            info = future.result()
             name = info.get("longName", "Unknown Company")
             sector = info.get("sector", "N/A")
             current_price = info.get("currentPrice", info.get("regularMarketPrice", "N/A"))
             
-            self.results_list.delete(0, tk.END)
-            self.results_list.insert(tk.END, f"{query} — {name}")
-            self.results_list.insert(tk.END, f"Sector: {sector}")
             if current_price != "N/A":
-                self.results_list.insert(tk.END, f"Current Price: ${current_price:.2f}")
+                price_row = f"Current Price: ${current_price:.2f}"
             else:
-                self.results_list.insert(tk.END, "Current Price: N/A")
-            self.results_list.insert(tk.END, "---")
-            self.results_list.insert(tk.END, "Double-click or use button to add")
+                price_row = "Current Price: N/A"
+            self.results_list.set_items([
+                f"{query} — {name}",
+                f"Sector: {sector}",
+                price_row,
+                "---",
+                "Double-click or use button to add",
+            ])
+            self._current_search_ticker = query
         except Exception as e:
+            self._current_search_ticker = None
             messagebox.showerror("Error", f"Ticker '{query}' not found or error: {str(e)}")
+            return
+
+        if on_success is not None:
+            on_success()
 
     def add_ticker(self):
-        selection = self.results_list.get(0)
-        if selection and "—" in selection:
-            ticker = selection.split("—")[0].strip()
-            if ticker in self.selected_tickers:
+        ticker = self._current_search_ticker
+        if ticker is not None:
+            if ticker in self._ticker_set:
                 messagebox.showwarning("Warning", f"Ticker {ticker} is already in your portfolio.")
                 return
                 
             self.selected_tickers.append(ticker)
+            self._ticker_set.add(ticker)
             self.selected_weights.append(None)
-            self.portfolio_list.insert(tk.END, f"{ticker} — weight: NOT SET")
+            self._unset_weights += 1
+            self._portfolio_rows.append(f"{ticker} — weight: NOT SET")
+            self.portfolio_list.insert(tk.END, self._portfolio_rows[-1])
             self.weight_entry.delete(0, tk.END)
             self.weight_entry.focus()
         else:
@@ -252,17 +439,24 @@ class PortfolioSelectorGUI:
         if selection:
             idx = selection[0]
             ticker = self.selected_tickers[idx]
+            self._ticker_set.discard(ticker)
             self.portfolio_list.delete(idx)
             self.selected_tickers.pop(idx)
-            self.selected_weights.pop(idx)
+            if self.selected_weights.pop(idx) is None:
+                self._unset_weights -= 1
+            self._portfolio_rows.pop(idx)
         else:
             messagebox.showwarning("Warning", "Please select a ticker to remove.")
 
     def clear_portfolio(self):
         if self.selected_tickers and messagebox.askyesno("Confirm", "Are you sure you want to clear the entire portfolio?"):
-            self.portfolio_list.delete(0, tk.END)
             self.selected_tickers.clear()
             self.selected_weights.clear()
+            self._portfolio_rows.clear()
+            self._ticker_set.clear()
+            self._unset_weights = 0
+            self._current_search_ticker = None
+            self._refresh_portfolio_list()
 
     def set_weight(self):
         if not self.selected_tickers:
@@ -284,27 +478,31 @@ class PortfolioSelectorGUI:
         else:
             idx = len(self.selected_weights) - 1
 
+        if self.selected_weights[idx] is None:
+            self._unset_weights -= 1
         self.selected_weights[idx] = weight
 
         t = self.selected_tickers[idx]
+        self._portfolio_rows[idx] = f"{t} — weight: {weight:.2f}"
         self.portfolio_list.delete(idx)
-        self.portfolio_list.insert(idx, f"{t} — weight: {weight:.2f}")
+        self.portfolio_list.insert(idx, self._portfolio_rows[idx])
 
     def confirm(self):
         if not self.selected_tickers:
             messagebox.showerror("Error", "Portfolio is empty. Add at least one ticker.")
             return
             
-        if None in self.selected_weights:
+        if self._unset_weights:
             messagebox.showerror("Error", "Set all weights before confirming.")
             return
 
-        total = sum(self.selected_weights)
+        w = np.asarray(self.selected_weights, dtype=np.float64)
+        total = w.sum()
         if total <= 0:
             messagebox.showerror("Error", "Total weight must be positive.")
             return
             
-        self.selected_weights = [w / total for w in self.selected_weights]
+        self.selected_weights = (w / total).tolist()
 
         portfolio_summary = "Portfolio confirmed:\n"
         for i, (ticker, weight) in enumerate(zip(self.selected_tickers, self.selected_weights)):
@@ -1,14 +1,14 @@
-from data_loader import load_data
+from data_loader import load_data, clear_cache
 from portfolio_analysis import analyze_portfolio, generate_analysis_report
 from prediction import train_model, forecast_future_days, plot_with_predictions
 from simulation import run_scenario
 from visualisation import plot_prediction, plot_scenario, plot_portfolio_analysis, plot_drawdown, interactive_toggle_plot
 from get_user_portfolio import get_user_portfolio
-from portfolio_builder import build_portfolio_series
+from portfolio_builder import build_portfolio_series, build_price_matrix
 from gui_portfolio_selector import select_portfolio_gui
-from montecarlo import run_monte_carlo_simulation
+from montecarlo import run_monte_carlo_simulation, warmup_gbm_kernel
 
-import pandas as pd
+import sys
 
 
 
@@ -23,6 +23,7 @@ def main():
     pred = None
     scenario = None
     current_period = "10y"
+    use_cache = "--no-cache" not in sys.argv    # Aufruf mit --no-cache erzwingt neuen Download
 
     while True:
         print("\n========== PORTFOLIO MANAGER ==========")
@@ -34,16 +35,18 @@ def main():
         print("6) Monte Carlo Simulation")
         #print("7) Run scenario analysis")
         print("7) Plot price history")
-        print("8) Exit")
+        print("8) Clear download cache")
+        print("9) Exit")
         print("========================================")
 
-        choice = input("Choose an option (1-8): ").strip()
+        choice = input("Choose an option (1-9): ").strip()
 
         ##### 1) Load portfolio
         if choice == "1":
             tickers, weights = select_portfolio_gui()
-            data = load_data(tickers, period=current_period)
+            data = load_data(tickers, period=current_period, use_cache=use_cache)
             portfolio_series = build_portfolio_series(data, tickers, weights)
+            warmup_gbm_kernel(len(tickers))   # Monte-Carlo-Kernel vorab kompilieren
             print(f"\nPortfolio successfully loaded: {tickers}")
             print(f"Data period: {current_period}")
 
@@ -73,7 +76,7 @@ def main():
                 selected_period = period_map[period_choice]
                 if selected_period != current_period:
                     print(f"Loading data for {selected_period} period...")
-                    data = load_data(tickers, period=selected_period)
+                    data = load_data(tickers, period=selected_period, use_cache=use_cache)
                     portfolio_series = build_portfolio_series(data, tickers, weights)
                     current_period = selected_period
             else:
@@ -128,8 +131,7 @@ def main():
                 print("Error: Load portfolio first (option 1).")
                 continue
 
-            price_df = pd.concat([data[t]["Close"] for t in tickers], axis=1)
-            price_df.columns = tickers
+            price_df = build_price_matrix(data, tickers)
 
             run_monte_carlo_simulation(price_df, weights)
             
@@ -163,8 +165,13 @@ def main():
             interactive_toggle_plot(data, weights)
 
 
-        ##### 9) Exit
+        ##### 8) Clear cache
         elif choice == "8":
+            removed = clear_cache()
+            print(f"Cache cleared ({removed} files removed).")
+
+        ##### 9) Exit
+        elif choice == "9":
             print("Goodbye!")
             break
 
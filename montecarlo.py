@@ -1,44 +1,112 @@
+import multiprocessing as mp
+import os
+import tempfile
+from functools import lru_cache
+from dataclasses import dataclass
+from typing import Any, Optional
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
+import matplotlib.dates as mdates
+from matplotlib.collections import LineCollection
+from scipy.linalg.blas import strmm
+
+try:
+    from numba import njit, prange
+except ImportError:   # numba ist optional, sonst NumPy-Pfad
+    njit = None
+
+try:
+    import numexpr as ne
+except ImportError:   # numexpr ist optional (fusioniert drift + exp im NumPy-Pfad)
+    ne = None
+
+try:
+    import cupy as cp
+except ImportError:   # cupy ist optional (nur für backend="cuda")
+    cp = None
 
 # ============================================================
 # =============== 1. MONTE-CARLO-SIMULATION ==================
 # ============================================================
 
-def simulate_correlated_gbm(price_df, weights, T_days=252, n_sims=5000, seed=None):
+# Ab dieser Anzahl Simulationen lohnt sich die Verteilung auf mehrere Prozesse
+PARALLEL_MIN_SIMS = 20_000
+
+
+@dataclass(slots=True)
+class MCResult:
+    """Ergebnis von simulate_correlated_gbm"""
+    portfolio_paths: np.ndarray          # (n_steps + 1, n_sims), float32
+    terminal_log_returns: np.ndarray     # (n_sims,)
+    terminal_returns: np.ndarray         # (n_sims,)
+    VaR_95: float
+    CVaR_95: float
+    dates: pd.DatetimeIndex
+    date_nums: np.ndarray                # dates als Matplotlib-Datumszahlen
+    asset_paths: Optional[Any] = None    # (n_steps + 1, n_sims, n_assets), nur mit keep_asset_paths (CuPy bei backend="cuda")
+
+
+def simulate_correlated_gbm(price_df, weights, T_days=252, n_sims=5000, seed=None, backend="numpy",
+                            n_workers=None, keep_asset_paths=False, antithetic=False,
+                            store_paths_on_disk=False):
     """
     Simuliert zukünftige Portfolioverläufe mit einem
     korrelierten Geometric-Brownian-Motion-(GBM)-Modell.
+
+    Die Gewichtung erfolgt direkt während der Simulation; die vollständigen
+    Asset-Pfade (n_steps + 1, n_sims, n_assets) werden nur mit
+    keep_asset_paths=True aufbewahrt, sonst ist asset_paths None.
+    store_paths_on_disk=True legt sie (CPU-Backend) unabhängig von der Grösse
+    als np.memmap auf einer temporären Datei ab statt im RAM; die Datei wird
+    gelöscht, sobald das Array freigegeben wird.
+
+    antithetic=True verwendet antithetische Zufallszahlen: zu jedem Pfad gibt es
+    einen Partnerpfad mit negierten Schocks. Die Pfadpaare sind negativ
+    korreliert, dadurch streuen VaR/CVaR und die Renditekennzahlen bei
+    gleicher Pfadanzahl deutlich weniger. n_sims muss dafür gerade sein.
+
+    n_workers > 1 verteilt die Simulationen in Blöcken auf mehrere Prozesse
+    (höchstens einer pro Kern). Das gilt nur für den NumPy-Pfad ohne Numba:
+    der Numba-Kernel rechnet bereits mit prange auf allen Kernen, dort wird
+    n_workers ignoriert.
+
+    backend="cuda" rechnet die Pfade mit CuPy (float32) auf der GPU;
+    asset_paths bleibt dann ein CuPy-Array auf dem Gerät, nur die
+    Portfolio-Pfade werden auf den Host kopiert.
+
+    Rückgabe: MCResult
     """
     ###############################
     #### Einführung Variablen: ####
     ###############################
 
 
-    rng = np.random.default_rng(seed)                           # Generator Randomzahl  
-    logret = np.log(price_df / price_df.shift(1)).dropna()      # Tägliche logarithmischen Renditen
-    mu = np.minimum(logret.mean().values, 0.0003)               # Drift  - Schätzung = Begrenzung nach oben (Optimisusmus vermeiden)
-    cov = logret.cov().values                                   # Kovarianzmatrix: enthält Volatilitäten und Korrelationen der Assets
-    n_assets = price_df.shape[1]                                # Anzahl Assets
-    n_steps = T_days                                            # Anzahl Handelstage in der Simulation
-    S0 = price_df.iloc[-1].values.astype(float)                 # Letzte beobachtete Preise als Startwerte 
-    L = np.linalg.cholesky(cov)                                 # Cholesky-Zerlegung, um Korrelationen zwischen Assets zu erzeugen
-    sigma_sq = np.diag(cov) 
-    drift = mu - 0.5 * sigma_sq # = μ - 0.5 * σ²                # Drift-Term der GBM = Geometric Brownian Motion
-    asset_paths = np.empty((n_assets, n_steps + 1, n_sims))     # Speicher für simulierte Asset-Pfade
-    asset_paths[:, 0, :] = S0[:, None]
-
-    # Simulation der Asset-Preispfade
-    for t in range(1, n_steps + 1):                             # Von Tag 1 bis Tag 252
-        Z = rng.standard_normal((n_assets, n_sims))             # Unkorrelierte Standardnormal-Zufallszahlen
-        correlated = L @ Z                                      # Einführung der Korrelationen
+    if antithetic and n_sims % 2:
+        raise ValueError("antithetic=True requires an even n_sims")
 
-        asset_paths[:, t, :] = asset_paths[:, t - 1, :] * np.exp(drift[:, None] + correlated)   # GBM-Update-Gleichung "adjusted" 
+    keep_asset_paths = keep_asset_paths or store_paths_on_disk
 
-    # Aggregation der einzelnen Assets zu Portfolio-Pfaden
-    weights = np.array(weights)
-    portfolio_paths = np.tensordot(asset_paths, weights, axes=(0, 0))
+    rng = np.random.default_rng(seed)                           # Generator Randomzahl  
+    n_steps = T_days                                            # Anzahl Handelstage in der Simulation
+    S0, L, drift = _prepare_gbm_params(price_df)                # Startwerte, Cholesky-Faktor, Drift (gecacht)
+    weights = np.asarray(weights, dtype=np.float32)
+
+    # Simulation der Asset-Preispfade, Aggregation zu Portfolio-Pfaden blockweise
+    if backend == "cuda":
+        if cp is None:
+            raise ImportError("backend='cuda' requires cupy to be installed")
+        portfolio_paths, asset_paths = _simulate_paths_cuda(
+            S0, L, drift, weights, n_steps, n_sims, seed, keep_asset_paths, antithetic)
+    elif njit is None and n_workers is not None and n_workers > 1:
+        # Prozesse nur für den NumPy-Pfad; nicht mehr Worker als Kerne
+        portfolio_paths, asset_paths = _simulate_paths_multiprocess(
+            S0, L, drift, weights, n_steps, n_sims, seed, min(n_workers, os.cpu_count() or 1),
+            keep_asset_paths, antithetic, store_paths_on_disk)
+    else:
+        portfolio_paths, asset_paths = _simulate_paths_cpu(
+            S0, L, drift, weights, n_steps, n_sims, seed, rng, keep_asset_paths, antithetic,
+            store_paths_on_disk)
 
     # Berechnung der Endrenditen
     terminal_vals = portfolio_paths[-1]
@@ -47,24 +115,296 @@ def simulate_correlated_gbm(price_df, weights, T_days=252, n_sims=5000, seed=Non
     terminal_returns = terminal_vals / initial_vals - 1
     terminal_log_returns = np.log(terminal_vals / initial_vals)
 
-    # Risikokennzahlen basierend auf Verlusten
+    # Risikokennzahlen basierend auf Verlusten (Reduktion in float32, nur die Skalare in float64)
     losses = -terminal_log_returns
-    var95 = np.percentile(losses, 95)                           # Value at Risk (95 %)
-    cvar95 = losses[losses >= var95].mean()                     # Conditional VaR (Expected Shortfall)
+    k = max(1, int(np.ceil(0.05 * losses.size)))               # Anzahl Szenarien im schlechtesten 5 %-Bereich
+    tail = np.partition(losses, -k)[-k:]                        # O(n)-Auswahl statt vollständiger Sortierung
+    var95 = float(tail.min())                                   # Value at Risk (95 %)
+    cvar95 = float(tail.mean(dtype=np.float64))                 # Conditional VaR (Expected Shortfall)
+
+    # Zeitachse mit Handelstagen für die Plots (gecacht)
+    sim_dates, sim_date_nums = _simulation_dates(price_df.index[-1], n_steps)
+
+    return MCResult(
+        portfolio_paths=portfolio_paths,
+        terminal_log_returns=terminal_log_returns,
+        terminal_returns=terminal_returns,
+        VaR_95=var95,
+        CVaR_95=cvar95,
+        dates=sim_dates,
+        date_nums=sim_date_nums,
+        asset_paths=asset_paths,
+    )
 
-    # Zeitachse mit Handelstagen für die Plots
-    last_date = price_df.index[-1]
+
+@lru_cache(maxsize=32)
+def _simulation_dates(last_date, n_steps):
+    """Handelstage ab last_date und deren Matplotlib-Datumszahlen (einmal pro Horizont berechnet)"""
     sim_dates = pd.bdate_range(start=last_date, periods=n_steps + 1)
+    date_nums = mdates.date2num(sim_dates.to_pydatetime())
+    date_nums.setflags(write=False)                             # Gecachtes Array vor Veränderung schützen
+    return sim_dates, date_nums
+
+
+# Parameter-Cache: hängt nur von den Kursdaten ab, nicht von Seed oder Pfadanzahl
+_GBM_PARAM_CACHE = {}
+_GBM_PARAM_CACHE_SIZE = 8
+
+def _prepare_gbm_params(price_df):
+    """
+    Schätzt Startwerte, Cholesky-Faktor und Drift aus den Kursdaten.
+    Wiederholte Läufe auf denselben Daten verwenden das gecachte Ergebnis.
+    """
+    key = (
+        tuple(price_df.columns),
+        price_df.index[0],
+        price_df.index[-1],
+        price_df.shape[0],
+        tuple(price_df.iloc[-1].tolist()),
+    )
+    params = _GBM_PARAM_CACHE.get(key)
+    if params is not None:
+        return params
+
+    prices = np.ascontiguousarray(price_df.to_numpy(dtype=np.float64))
+    arr = np.diff(np.log(prices), axis=0)                       # Tägliche logarithmischen Renditen (ohne pandas-Umweg)
+    if np.isnan(arr).any():
+        arr = arr[~np.isnan(arr).any(axis=1)]                   # Tage mit Lücken verwerfen (wie dropna)
+    mean = arr.mean(axis=0)
+    mu = np.minimum(mean, 0.0003)                               # Drift  - Schätzung = Begrenzung nach oben (Optimisusmus vermeiden)
+    centered = arr - mean
+    cov = centered.T @ centered / (arr.shape[0] - 1)            # Kovarianzmatrix (ein BLAS-Aufruf): Volatilitäten und Korrelationen
+    S0 = price_df.iloc[-1].values.astype(float)                 # Letzte beobachtete Preise als Startwerte 
+    L = np.linalg.cholesky(cov)                                 # Cholesky-Zerlegung, um Korrelationen zwischen Assets zu erzeugen
+    sigma_sq = np.einsum('ii->i', cov)                          # Varianzen = Diagonale (View, keine Kopie)
+    drift = mu - 0.5 * sigma_sq # = μ - 0.5 * σ²                # Drift-Term der GBM = Geometric Brownian Motion
+
+    params = (S0, L, drift)
+    for arr in params:
+        arr.setflags(write=False)                               # Gecachte Arrays vor Veränderung schützen
+
+    if len(_GBM_PARAM_CACHE) >= _GBM_PARAM_CACHE_SIZE:
+        _GBM_PARAM_CACHE.pop(next(iter(_GBM_PARAM_CACHE)))      # Ältesten Eintrag verwerfen
+    _GBM_PARAM_CACHE[key] = params
+    return params
+
 
-    return {
-        "asset_paths": asset_paths,
-        "portfolio_paths": portfolio_paths,
-        "terminal_log_returns": terminal_log_returns,
-        "terminal_returns": terminal_returns,
-        "VaR_95": var95,
-        "CVaR_95": cvar95,
-        "dates": sim_dates,
-    }
+# Ab dieser Grösse werden die Pfade in eine temporäre Datei gemappt statt im RAM gehalten
+MEMMAP_MIN_BYTES = 1 << 30   # 1 GB
+# Zielgrösse der Zwischen-Arrays pro Block im NumPy-Pfad (bleibt im Cache bzw. klein im RAM)
+BLOCK_BYTES = 32 << 20       # 32 MB
+
+def _allocate_paths(shape, on_disk=False):
+    """float32-Array für Pfade; sehr grosse Arrays (oder on_disk=True) als np.memmap auf einer temporären Datei"""
+    if not on_disk and np.prod(shape) * 4 < MEMMAP_MIN_BYTES:
+        return np.empty(shape, dtype=np.float32)
+    # Die Datei verschwindet automatisch, sobald das Memmap freigegeben wird
+    return np.memmap(tempfile.TemporaryFile(prefix="pynance_paths_"), dtype=np.float32, mode="w+", shape=shape)
+
+
+def _simulate_paths_cpu(S0, L, drift, weights, n_steps, n_sims, seed, rng, keep_asset_paths=False,
+                        antithetic=False, paths_on_disk=False):
+    """
+    Portfolio-Pfade (n_steps + 1, n_sims) als float32 auf der CPU (Numba oder NumPy),
+    optional zusätzlich die Asset-Pfade (n_steps + 1, n_sims, n_assets).
+    """
+    # float32 reicht für GBM-Eingaben und halbiert Speicher/Bandbreite
+    S0 = S0.astype(np.float32)
+    L = L.astype(np.float32)
+    drift = drift.astype(np.float32)
+    weights = weights.astype(np.float32, copy=False)
+
+    n_assets = S0.shape[0]
+    portfolio_paths = _allocate_paths((n_steps + 1, n_sims))
+    portfolio_paths[0] = S0 @ weights
+    asset_paths = None
+    if keep_asset_paths:
+        asset_paths = _allocate_paths((n_steps + 1, n_sims, n_assets), paths_on_disk)   # (Zeit, Pfad, Asset)
+        asset_paths[0] = S0
+
+    if njit is not None:
+        # Kompilierter Kernel: gewichtet direkt pro Zeitschritt, parallel über die Simulationen
+        base_seed = seed if seed is not None else int(rng.integers(2**31))
+        out = asset_paths if keep_asset_paths else np.empty((0, 0, 0), dtype=np.float32)
+        _gbm_kernel(S0, L, drift, weights, n_steps, n_sims, base_seed % (2**32 - n_sims),
+                    portfolio_paths, out, keep_asset_paths, antithetic)
+    else:
+        # NumPy: alle Zeitschritte eines Blocks auf einmal statt Python-Schleife,
+        # blockweise über die Simulationen, damit die Zwischen-Arrays klein bleiben
+        block = max(1, BLOCK_BYTES // (4 * n_assets * n_steps))
+        if antithetic:
+            block = max(2, block - block % 2)                           # Paare nicht auf zwei Blöcke verteilen
+        # Kumulierte Drift bis Schritt t und log S0, einmal für alle Blöcke
+        drift_t = np.arange(1, n_steps + 1, dtype=np.float32)[:, None, None] * drift
+        log_S0 = np.log(S0)
+
+        for start in range(0, n_sims, block):
+            stop = min(start + block, n_sims)
+            width = stop - start
+            if antithetic:
+                # Zweite Blockhälfte = negierte erste Hälfte (L @ -Z = -(L @ Z))
+                Z_half = rng.standard_normal((n_steps, width // 2, n_assets), dtype=np.float32)
+                Z = np.concatenate([Z_half, -Z_half], axis=1).reshape(n_steps * width, n_assets)
+            else:
+                Z = rng.standard_normal((n_steps * width, n_assets), dtype=np.float32)   # Unkorrelierte Standardnormal-Zufallszahlen
+
+            # Einführung der Korrelationen: Z @ L.T als Dreiecksprodukt (L @ Z.T).T per BLAS-strmm,
+            # halbe FLOPs gegenüber GEMM und direkt in Z geschrieben (Z.T ist Fortran-zusammenhängend)
+            shocks = strmm(1.0, L, Z.T, lower=1, overwrite_b=1).T.reshape(n_steps, width, n_assets)
+            np.cumsum(shocks, axis=0, out=shocks)                       # Σ korrelierte Schocks bis Schritt t
+
+            # log S_t = log S0 + drift * t + Σ Schocks, dann exp
+            if ne is not None:
+                # Ein fusionierter, mehrfädiger Durchlauf ohne Zwischen-Arrays
+                block_paths = ne.evaluate("exp(log_S0 + drift_t + shocks)", out=shocks,
+                                          local_dict={"log_S0": log_S0, "drift_t": drift_t, "shocks": shocks})
+            else:
+                shocks += drift_t
+                shocks += log_S0
+                block_paths = np.exp(shocks, out=shocks)                # Ein exp-Aufruf pro Block
+
+            portfolio_paths[1:, start:stop] = block_paths @ weights     # Gewichtung, solange der Block im Cache liegt
+            if keep_asset_paths:
+                asset_paths[1:, start:stop] = block_paths
+
+    return portfolio_paths, asset_paths
+
+
+def _init_worker():
+    """Ein Thread pro Worker-Prozess, sonst rechnen n_workers × Kerne Threads gegeneinander"""
+    if ne is not None:
+        ne.set_num_threads(1)
+
+
+def _simulate_chunk(args):
+    """Ein Block von Simulationen in einem Worker-Prozess"""
+    S0, L, drift, weights, n_steps, n_sims, seed_seq, keep_asset_paths, antithetic = args
+    rng = np.random.default_rng(seed_seq)
+    numba_seed = int(seed_seq.generate_state(1)[0] % 2**31)
+    return _simulate_paths_cpu(S0, L, drift, weights, n_steps, n_sims, numba_seed, rng, keep_asset_paths,
+                               antithetic)
+
+
+def _simulate_paths_multiprocess(S0, L, drift, weights, n_steps, n_sims, seed, n_workers, keep_asset_paths=False,
+                                 antithetic=False, paths_on_disk=False):
+    """
+    Verteilt n_sims auf n_workers Prozesse und fügt die Blöcke zusammen (NumPy-Pfad).
+    Jeder Worker erhält nur S0, L, drift und die Gewichte sowie eine eigene
+    SeedSequence, damit die Ergebnisse reproduzierbar bleiben.
+    """
+    unit = 2 if antithetic else 1                               # Antithetische Paare bleiben im selben Block
+    n_units = n_sims // unit
+    chunk_sizes = [unit * (n_units // n_workers + (1 if i < n_units % n_workers else 0)) for i in range(n_workers)]
+    seeds = np.random.SeedSequence(seed).spawn(n_workers)
+    tasks = [(S0, L, drift, weights, n_steps, size, seq, keep_asset_paths, antithetic)
+             for size, seq in zip(chunk_sizes, seeds) if size > 0]
+
+    with mp.Pool(len(tasks), initializer=_init_worker) as pool:
+        parts = pool.map(_simulate_chunk, tasks)
+
+    portfolio_paths = np.concatenate([p for p, _ in parts], axis=1)
+    asset_paths = None
+    if keep_asset_paths:
+        asset_paths = _allocate_paths((n_steps + 1, n_sims, S0.shape[0]), paths_on_disk)
+        np.concatenate([a for _, a in parts], axis=1, out=asset_paths)
+    return portfolio_paths, asset_paths
+
+
+def _simulate_paths_cuda(S0, L, drift, weights, n_steps, n_sims, seed, keep_asset_paths=False, antithetic=False):
+    """
+    Portfolio-Pfade (n_steps + 1, n_sims) als float32 auf der GPU (CuPy), als NumPy-Array zurückgegeben;
+    die Asset-Pfade bleiben (falls gewünscht) als CuPy-Array auf dem Gerät.
+    """
+    rng = cp.random.default_rng(seed)
+    S0_gpu = cp.asarray(S0, dtype=cp.float32)
+    w_gpu = cp.asarray(weights, dtype=cp.float32)
+
+    if antithetic:
+        Z_half = rng.standard_normal((n_steps, n_sims // 2, S0.shape[0]), dtype=cp.float32)
+        Z = cp.concatenate([Z_half, -Z_half], axis=1)
+        del Z_half
+    else:
+        Z = rng.standard_normal((n_steps, n_sims, S0.shape[0]), dtype=cp.float32)
+    increments = Z @ cp.asarray(L, dtype=cp.float32).T
+    del Z
+    increments += cp.asarray(drift, dtype=cp.float32)
+    increments[0] += cp.log(S0_gpu)
+    cp.cumsum(increments, axis=0, out=increments)
+    paths = cp.exp(increments, out=increments)                  # (n_steps, n_sims, n_assets)
+
+    portfolio_paths = np.empty((n_steps + 1, n_sims), dtype=np.float32)
+    portfolio_paths[0] = float(S0_gpu @ w_gpu)
+    portfolio_paths[1:] = cp.asnumpy(paths @ w_gpu)             # Nur die Portfolio-Pfade zurück auf den Host
+
+    if not keep_asset_paths:
+        return portfolio_paths, None
+    asset_paths = cp.empty((n_steps + 1, n_sims, S0.shape[0]), dtype=cp.float32)
+    asset_paths[0] = S0_gpu
+    asset_paths[1:] = paths
+    return portfolio_paths, asset_paths
+
+
+def _gbm_kernel_py(S0, L, drift, weights, n_steps, n_sims, seed, port, out, keep_asset_paths, antithetic):
+    """
+    GBM-Kernel für Numba: jeder Pfad wird unabhängig berechnet,
+    ohne grosse Zwischen-Arrays (Z, correlated, exp).
+    Pro Zeitschritt wird nur der gewichtete Portfoliowert nach port[t, s]
+    geschrieben, die Asset-Preise nur bei keep_asset_paths nach out[t, s, a].
+    Die Preise werden wie im NumPy-Pfad im Log-Raum aufsummiert
+    (log S_t = log S_{t-1} + drift + Schock) und je Ausgabeschritt einmal
+    exponentiert, statt Faktoren aufzumultiplizieren.
+    Jeder Pfad erhält seinen eigenen Seed (seed + s), damit das Ergebnis
+    unabhängig von der Thread-Aufteilung reproduzierbar ist.
+    Bei antithetic verwendet Pfad s + n_sims/2 den Seed von Pfad s mit negierten Schocks.
+    """
+    n_assets = S0.shape[0]
+    log_S0 = np.log(S0)
+    half = n_sims // 2
+    for s in prange(n_sims):
+        # prange-Index ist vorzeichenlos; s - half würde sonst zu float64 (seed(float64) kompiliert nicht)
+        src = np.int64(s)
+        sign = np.float32(1.0)
+        if antithetic and s >= half:
+            src = np.int64(s) - half
+            sign = np.float32(-1.0)
+        np.random.seed(seed + src)                                  # Zustand des ausführenden Threads
+        log_prev = log_S0.copy()
+        z = np.empty(n_assets, dtype=S0.dtype)
+        for t in range(1, n_steps + 1):
+            for a in range(n_assets):
+                z[a] = sign * np.random.standard_normal()
+            value = np.float32(0.0)
+            for a in range(n_assets):
+                corr = np.float32(0.0)
+                for j in range(a + 1):                              # L ist untere Dreiecksmatrix
+                    corr += L[a, j] * z[j]
+                log_prev[a] += drift[a] + corr                      # Summe im Log-Raum
+                price = np.exp(log_prev[a])
+                value += weights[a] * price
+                if keep_asset_paths:
+                    out[t, s, a] = price
+            port[t, s] = value
+
+
+if njit is not None:
+    _gbm_kernel = njit(parallel=True, fastmath=True, cache=True)(_gbm_kernel_py)
+
+
+def warmup_gbm_kernel(n_assets):
+    """
+    Kompiliert den Numba-Kernel vorab (z. B. direkt nach dem Laden des Portfolios),
+    damit der erste Monte-Carlo-Lauf nicht auf den JIT-Compiler warten muss.
+    Dank cache=True wird der Maschinencode zusätzlich auf der Festplatte gespeichert.
+    """
+    if njit is None:
+        return
+    S0 = np.ones(n_assets, dtype=np.float32)
+    L = np.eye(n_assets, dtype=np.float32)
+    drift = np.zeros(n_assets, dtype=np.float32)
+    weights = np.full(n_assets, 1.0 / n_assets, dtype=np.float32)
+    port = np.empty((2, 1), dtype=np.float32)
+    out = np.empty((0, 0, 0), dtype=np.float32)
+    _gbm_kernel(S0, L, drift, weights, 1, 1, 0, port, out, False, False)
 
 
 # =====================================================================
@@ -79,9 +419,10 @@ def plot_montecarlo_results(result, historical_prices, historical_dates, max_spa
     - Histogramm: Verteilung der Endrenditen
     """
 
-    portfolio = result["portfolio_paths"]
-    dates = result["dates"]
-    terminal_returns = result["terminal_returns"]
+    portfolio = result.portfolio_paths
+    x = result.date_nums                                        # Datumszahlen statt DatetimeIndex (keine Umrechnung pro Artist)
+    x_hist = mdates.date2num(historical_dates.to_pydatetime())
+    terminal_returns = result.terminal_returns
 
     # Layout: grosser Plot oben, zwei kleinere unten
     fig = plt.figure(figsize=(14, 10))
@@ -97,7 +438,7 @@ def plot_montecarlo_results(result, historical_prices, historical_dates, max_spa
 
     # Historische Portfolioentwicklung
     ax_spaghetti.plot(
-        historical_dates,
+        x_hist,
         historical_prices,
         linewidth=2.5,
         label="Historical Portfolio"
@@ -105,13 +446,25 @@ def plot_montecarlo_results(result, historical_prices, historical_dates, max_spa
 
     # Zufällige Auswahl von Pfaden, um Überlagerung zu vermeiden
     n_paths = min(max_spaghetti, portfolio.shape[1])
-    idx = np.random.choice(portfolio.shape[1], n_paths, replace=False)
-
-    for i in idx:
-        ax_spaghetti.plot(dates, portfolio[:, i], linewidth=0.7, alpha=0.5)
+    idx = np.random.default_rng().choice(portfolio.shape[1], n_paths, replace=False, shuffle=False)   # Reihenfolge egal
+
+    # Zeitachse ausdünnen (mehr Punkte als Pixel bringen nichts), letzter Tag bleibt erhalten
+    stride = max(1, len(x) // 500)
+    steps = np.unique(np.r_[0:len(x):stride, len(x) - 1])
+
+    # Alle Pfade als ein einziges Artist-Objekt statt einem plot()-Aufruf pro Pfad
+    segments = np.empty((n_paths, steps.size, 2))
+    segments[:, :, 0] = x[steps]
+    segments[:, :, 1] = portfolio[np.ix_(steps, idx)].T
+    ax_spaghetti.add_collection(LineCollection(
+        segments, linewidths=0.7, alpha=0.5,
+        colors=plt.rcParams["axes.prop_cycle"].by_key()["color"]
+    ))
+    ax_spaghetti.autoscale_view()
 
     # Visuelle Trennung zwischen Vergangenheit und Zukunft
-    ax_spaghetti.axvline(historical_dates[-1], linestyle="--", alpha=0.6)
+    ax_spaghetti.axvline(x_hist[-1], linestyle="--", alpha=0.6)
+    ax_spaghetti.xaxis_date()
 
     ax_spaghetti.set_title("Monte Carlo - Spaghetti Plot")
     ax_spaghetti.set_ylabel("Portfolio Value [USD]")
@@ -122,13 +475,16 @@ def plot_montecarlo_results(result, historical_prices, historical_dates, max_spa
     # 2) Fan-Chart
     # -------------------------------
 
-    # Perzentile beschreiben die Verteilung über die Zeit
-    percentiles = [5, 25, 50, 75, 95]
-    perc = np.percentile(portfolio, percentiles, axis=1)
+    # Perzentile beschreiben die Verteilung über die Zeit:
+    # alle fünf Ordnungsstatistiken pro Zeitschritt in einem Partitionierungsdurchlauf
+    n = portfolio.shape[1]
+    ranks = [int(0.05 * n), int(0.25 * n), n // 2, int(0.75 * n), min(int(0.95 * n), n - 1)]
+    perc = np.partition(portfolio, ranks, axis=1)[:, ranks].T
 
-    ax_fan.fill_between(dates, perc[0], perc[-1], alpha=0.3, label="5–95%")
-    ax_fan.fill_between(dates, perc[1], perc[-2], alpha=0.5, label="25–75%")
-    ax_fan.plot(dates, perc[2], linewidth=2, label="Median")
+    ax_fan.fill_between(x, perc[0], perc[-1], alpha=0.3, label="5–95%")
+    ax_fan.fill_between(x, perc[1], perc[-2], alpha=0.5, label="25–75%")
+    ax_fan.plot(x, perc[2], linewidth=2, label="Median")
+    ax_fan.xaxis_date()
 
     ax_fan.set_title("Monte Carlo – Fan Chart")
     ax_fan.set_ylabel("Portfolio Value [USD]")
@@ -139,7 +495,7 @@ def plot_montecarlo_results(result, historical_prices, historical_dates, max_spa
     # 3) Histogramm der Endrenditen
     # -------------------------------
 
-    ax_hist.hist(result["terminal_log_returns"], bins=40, label="Simulated outcomes")
+    ax_hist.hist(result.terminal_log_returns, bins=40, label="Simulated outcomes")
     ax_hist.set_xlabel("Log return")
     ax_hist.set_ylabel("Number of simulations")
     ax_hist.set_title("Terminal Log-Return Distribution")
@@ -155,6 +511,41 @@ def plot_montecarlo_results(result, historical_prices, historical_dates, max_spa
 # =============== 3. BENUTZERFUNKTION =================================
 # =====================================================================
 
+def _loss_min_max_py(tr):
+    """Verlustanteil, Minimum und Maximum in einem Durchlauf"""
+    n_loss = 0
+    lo = tr[0]
+    hi = tr[0]
+    for i in range(tr.size):
+        v = tr[i]
+        if v < 0:
+            n_loss += 1
+        if v < lo:
+            lo = v
+        if v > hi:
+            hi = v
+    return n_loss / tr.size, lo, hi
+
+
+if njit is not None:
+    _loss_min_max = njit(cache=True)(_loss_min_max_py)
+
+
+def summarize_returns(terminal_returns):
+    """Verlustwahrscheinlichkeit, Median, bestes und schlechtestes Ergebnis"""
+    tr = np.ascontiguousarray(terminal_returns)
+    if njit is not None:
+        prob_loss, worst, best = _loss_min_max(tr)
+    else:
+        prob_loss, worst, best = np.count_nonzero(tr < 0) / tr.size, tr.min(), tr.max()
+
+    n = tr.size
+    lo, hi = (n - 1) // 2, n // 2
+    part = np.partition(tr, [lo, hi])                               # Median ohne vollständige Sortierung
+    median = 0.5 * (part[lo] + part[hi])
+    return float(prob_loss), float(median), float(best), float(worst)
+
+
 def run_monte_carlo_simulation(price_df, weights):
     """
     High-Level-Funktion:
@@ -167,6 +558,7 @@ def run_monte_carlo_simulation(price_df, weights):
     # Benutzerdefinierter Zeithorizont und Anzahl Simulationen
     years = int(input("How many years to simulate? (e.g. 1, 5, 10): ").strip())
     sims = int(input("How many simulations? (500–20000 recommended): ").strip())
+    sims += sims % 2   # Antithetische Pfade kommen paarweise
 
     # Historische Portfoliozeitreihe zum Vergleich
     historical_prices = price_df.values @ np.array(weights)
@@ -181,17 +573,21 @@ def run_monte_carlo_simulation(price_df, weights):
         weights=weights,
         T_days=days,
         n_sims=sims,
-        seed=42
+        seed=42,
+        antithetic=True,
+        # Prozesse nur ohne Numba, der Numba-Kernel nutzt die Kerne bereits selbst
+        n_workers=os.cpu_count() if njit is None and sims >= PARALLEL_MIN_SIMS else None
     )
 
     # Zusammenfassung der Risikokennzahlen
     print("\nMonte Carlo Results:")
-    print(f"95% VaR  (portfolio loss): {result['VaR_95']:.3f}")
-    print(f"95% CVaR (expected shortfall): {result['CVaR_95']:.3f}")
-    print(f"Probability of loss: {np.mean(result['terminal_returns'] < 0)*100:.2f}%")
-    print(f"Median return: {np.median(result['terminal_returns'])*100:.2f}%")
-    print(f"Best case return:  {np.max(result['terminal_returns'])*100:.2f}%")
-    print(f"Worst case return: {np.min(result['terminal_returns'])*100:.2f}%")
+    print(f"95% VaR  (portfolio loss): {result.VaR_95:.3f}")
+    print(f"95% CVaR (expected shortfall): {result.CVaR_95:.3f}")
+    prob_loss, median, best, worst = summarize_returns(result.terminal_returns)
+    print(f"Probability of loss: {prob_loss*100:.2f}%")
+    print(f"Median return: {median*100:.2f}%")
+    print(f"Best case return:  {best*100:.2f}%")
+    print(f"Worst case return: {worst*100:.2f}%")
 
     # Visualisierung der Ergebnisse
     plot_montecarlo_results(result, historical_prices, historical_dates)
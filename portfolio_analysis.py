@@ -1,50 +1,71 @@
 # portfolio_analysis.py
+from collections import defaultdict
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 from scipy import stats
 from asset_database import get_asset_info, get_portfolio_allocation
+from portfolio_builder import build_return_matrix
+
+try:
+    from numba import njit
+except ImportError:   # numba ist optional, sonst NumPy-Pfade
+    njit = None
+
+try:
+    import cupy as cp
+except ImportError:   # cupy ist optional (Kovarianz grosser Portfolios auf der GPU)
+    cp = None
+
+GPU_MIN_ASSETS = 100   # darunter lohnt sich der Transfer auf die GPU nicht
 
 def analyze_portfolio(data, weights, risk_free_rate=0.02):
     """
     Enhanced portfolio analysis with asset class information
     """
     analysis_results = {}
-    
-    # Calculate daily returns
-    all_returns = []
     tickers = list(data.keys())
     
-    for ticker in tickers:
-        df = data[ticker]
-        returns = df["Close"].pct_change().dropna()
-        all_returns.append(returns)
+    # Tägliche Renditen als eine float64-Matrix (T, N), je Ticker auf dem eigenen Kalender berechnet;
+    # pandas nur noch für Beschriftungen
+    dates, returns = build_return_matrix(data, tickers)
+    
+    weights_array = np.asarray(weights, dtype=np.float64)
+    portfolio_returns = returns @ weights_array
+    
+    # Mittelwert, Volatilität und Drawdown nur einmal berechnen
+    annual_return = portfolio_returns.mean() * 252
+    annual_vol = portfolio_returns.std(ddof=1) * np.sqrt(252)
+    max_drawdown = calculate_max_drawdown(portfolio_returns)
     
-    returns_df = pd.concat(all_returns, axis=1)
-    returns_df.columns = tickers
+    # Kovarianzmatrix, Einzelstatistiken und Portfoliovarianz einmal berechnen und weiterreichen
+    cov_matrix = _covariance(returns)
+    mean_returns = returns.mean(axis=0)
+    std_returns = np.sqrt(np.diag(cov_matrix))                  # = Standardabweichung mit ddof=1
+    portfolio_variance, risk_contrib = _variance_and_risk_contrib(cov_matrix, weights_array)
+    var_95, cvar_95 = _var_cvar(portfolio_returns)
     
-    weights_array = np.array(weights)
-    portfolio_returns = returns_df.dot(weights_array)
+    # Aufzinsung im Log-Raum: Summe statt Produkt (kein Unter-/Überlauf bei langen Reihen)
+    log_growth = np.cumsum(np.log1p(portfolio_returns))
     
     analysis_results['basic_stats'] = {
-        'Total Return': (portfolio_returns + 1).prod() - 1,
-        'Annualized Return': portfolio_returns.mean() * 252,
-        'Annualized Volatility': portfolio_returns.std() * np.sqrt(252),
-        'Cumulative Return': (1 + portfolio_returns).cumprod() - 1
+        'Total Return': np.expm1(log_growth[-1]) if log_growth.size else np.nan,
+        'Annualized Return': annual_return,
+        'Annualized Volatility': annual_vol,
+        'Cumulative Return': pd.Series(np.expm1(log_growth), index=dates)
     }
     
     analysis_results['risk_adjusted'] = {
-        'Sharpe Ratio': (portfolio_returns.mean() * 252 - risk_free_rate) / 
-                        (portfolio_returns.std() * np.sqrt(252)),
+        'Sharpe Ratio': (annual_return - risk_free_rate) / annual_vol,
         'Sortino Ratio': calculate_sortino_ratio(portfolio_returns, risk_free_rate),
-        'Calmar Ratio': calculate_calmar_ratio(portfolio_returns)
+        'Calmar Ratio': calculate_calmar_ratio(portfolio_returns, max_drawdown)
     }
     
     analysis_results['risk_metrics'] = {
-        'Max Drawdown': calculate_max_drawdown(portfolio_returns),
-        'Value at Risk (95%)': calculate_var(portfolio_returns),
-        'Conditional VaR (95%)': calculate_cvar(portfolio_returns),
-        'Beta': calculate_portfolio_beta(returns_df, weights_array)
+        'Max Drawdown': max_drawdown,
+        'Value at Risk (95%)': var_95,
+        'Conditional VaR (95%)': cvar_95,
+        'Beta': calculate_portfolio_beta(returns, weights_array, portfolio_returns, tickers)
     }
     
     analysis_results['allocation'] = {
@@ -52,96 +73,200 @@ def analyze_portfolio(data, weights, risk_free_rate=0.02):
         'Asset Details': {ticker: get_asset_info(ticker) for ticker in tickers}
     }
     
+    skewness, kurtosis, jb_pvalue = calculate_moment_stats(portfolio_returns)
     analysis_results['statistical'] = {
-        'Skewness': portfolio_returns.skew(),
-        'Kurtosis': portfolio_returns.kurtosis(),
-        'Jarque-Bera Test': stats.jarque_bera(portfolio_returns.dropna())[1]  # p-value
+        'Skewness': skewness,
+        'Kurtosis': kurtosis,
+        'Jarque-Bera Test': jb_pvalue  # p-value
     }
     
     analysis_results['diversification'] = {
-        'Portfolio Variance': calculate_portfolio_variance(returns_df, weights_array),
-        'Diversification Ratio': calculate_diversification_ratio(returns_df, weights_array),
-        'Correlation Matrix': returns_df.corr()
+        'Portfolio Variance': portfolio_variance,
+        'Diversification Ratio': calculate_diversification_ratio(returns, weights_array,
+                                                                 std_returns, portfolio_variance),
+        'Correlation Matrix': pd.DataFrame(cov_matrix / np.outer(std_returns, std_returns),
+                                           index=tickers, columns=tickers)   # aus der Kovarianz, kein zweiter Durchlauf
     }
     
     analysis_results['components'] = {
-        'Individual Returns': returns_df.mean() * 252,
-        'Individual Volatilities': returns_df.std() * np.sqrt(252),
-        'Weight Contribution': calculate_weight_contributions(returns_df, weights_array),
-        'Risk Contribution': calculate_risk_contributions(returns_df, weights_array)
+        'Individual Returns': pd.Series(mean_returns * 252, index=tickers),
+        'Individual Volatilities': pd.Series(std_returns * np.sqrt(252), index=tickers),
+        'Weight Contribution': calculate_weight_contributions(returns, weights_array, mean_returns),
+        'Risk Contribution': risk_contrib
     }
     
     return analysis_results
 
 
+def calculate_moment_stats(returns):
+    """
+    Skewness, excess kurtosis (bias-corrected like pandas) and Jarque-Bera p-value
+    from one set of central moments
+    """
+    returns = np.ascontiguousarray(returns, dtype=np.float64)
+    n = len(returns)
+    if n < 4:
+        return np.nan, np.nan, np.nan
+    if njit is not None:
+        m2, m3, m4 = _central_moments(returns)
+    else:
+        c = returns - returns.mean()
+        c2 = c * c
+        m2, m3, m4 = c2.mean(), (c2 * c).mean(), (c2 * c2).mean()
+    if m2 == 0:
+        return np.nan, np.nan, np.nan
+    
+    g1 = m3 / m2 ** 1.5                                         # Schiefe (Stichprobe)
+    g2 = m4 / m2 ** 2 - 3                                       # Exzess-Kurtosis (Stichprobe)
+    skewness = np.sqrt(n * (n - 1)) / (n - 2) * g1
+    kurtosis = ((n + 1) * g2 + 6) * (n - 1) / ((n - 2) * (n - 3))
+    jb = n / 6 * (g1 ** 2 + g2 ** 2 / 4)                        # Jarque-Bera wie scipy (unkorrigierte Momente)
+    return skewness, kurtosis, stats.chi2.sf(jb, 2)
+
 def calculate_sortino_ratio(returns, risk_free_rate):
     """Calculate Sortino ratio (only downside risk)"""
+    returns = np.asarray(returns, dtype=np.float64)
     downside_returns = returns[returns < 0]
     if len(downside_returns) == 0:
         return np.nan
-    downside_risk = downside_returns.std() * np.sqrt(252)
+    downside_risk = downside_returns.std(ddof=1) * np.sqrt(252)
     excess_return = returns.mean() * 252 - risk_free_rate
     return excess_return / downside_risk if downside_risk != 0 else np.nan
 
-def calculate_calmar_ratio(returns):
+def calculate_calmar_ratio(returns, max_dd=None):
     """Calculate Calmar ratio (return vs max drawdown)"""
-    max_dd = calculate_max_drawdown(returns)
-    annual_return = returns.mean() * 252
+    if max_dd is None:
+        max_dd = calculate_max_drawdown(returns)
+    annual_return = np.mean(returns) * 252
     return annual_return / abs(max_dd) if max_dd != 0 else np.nan
 
 def calculate_max_drawdown(returns):
     """Calculate maximum drawdown"""
-    cumulative = (1 + returns).cumprod()
-    running_max = cumulative.expanding().max()
+    returns = np.asarray(returns, dtype=np.float64)
+    if returns.size == 0:                                       # z.B. nur ein Kurstag: wie früher NaN
+        return np.nan
+    if njit is not None:
+        return _max_drawdown(np.ascontiguousarray(returns, dtype=np.float64))
+    cumulative = np.cumprod(1 + np.asarray(returns, dtype=np.float64))
+    running_max = np.maximum.accumulate(cumulative)
     drawdown = (cumulative - running_max) / running_max
     return drawdown.min()
 
+def _max_drawdown(returns):
+    """Maximum drawdown in one pass (running peak, no temporary arrays)"""
+    value = 1.0
+    peak = 1.0 + returns[0]                                     # Höchststand ab dem ersten Tag (wie cumprod/cummax)
+    max_dd = 0.0
+    for r in returns:
+        value *= 1.0 + r
+        if value > peak:
+            peak = value
+        dd = (value - peak) / peak
+        if dd < max_dd:
+            max_dd = dd
+    return max_dd
+
+def _central_moments(returns):
+    """Second to fourth central moment (mean pass + one moment pass)"""
+    n = returns.size
+    mean = 0.0
+    for r in returns:
+        mean += r
+    mean /= n
+    m2 = m3 = m4 = 0.0
+    for r in returns:
+        c = r - mean
+        c2 = c * c
+        m2 += c2
+        m3 += c2 * c
+        m4 += c2 * c2
+    return m2 / n, m3 / n, m4 / n
+
+if njit is not None:
+    _max_drawdown = njit(cache=True)(_max_drawdown)
+    _central_moments = njit(cache=True)(_central_moments)
+
+def _var_cvar(returns, confidence_level=0.05):
+    """VaR und CVaR aus einer einzigen O(n)-Partitionierung"""
+    returns = np.asarray(returns, dtype=np.float64)
+    if returns.size == 0:                                       # keine gemeinsamen Handelstage
+        return np.nan, np.nan
+    k = min(int(confidence_level * len(returns)), len(returns) - 1)
+    part = np.partition(returns, k)
+    return part[k], part[:k + 1].mean()
+
 def calculate_var(returns, confidence_level=0.05):
     """Calculate Value at Risk"""
-    return np.percentile(returns, confidence_level * 100)
+    return _var_cvar(returns, confidence_level)[0]
 
 def calculate_cvar(returns, confidence_level=0.05):
     """Calculate Conditional Value at Risk (Expected Shortfall)"""
-    var = calculate_var(returns, confidence_level)
-    return returns[returns <= var].mean()
+    return _var_cvar(returns, confidence_level)[1]
 
-def calculate_portfolio_beta(returns_df, weights):
+def calculate_portfolio_beta(returns, weights, portfolio_returns=None, tickers=None):
     """Calculate portfolio beta relative to market (using SPY as proxy)"""
-    try:
-        if 'SPY' in returns_df.columns:
-            market_returns = returns_df['SPY']
-        else:
-            market_returns = returns_df.mean(axis=1)
-        
-        portfolio_returns = returns_df.dot(weights)
-        covariance = portfolio_returns.cov(market_returns)
-        market_variance = market_returns.var()
-        return covariance / market_variance if market_variance != 0 else np.nan
-    except:
-        return np.nan
+    if tickers is None:
+        tickers = list(returns.columns)
+    returns = np.asarray(returns, dtype=np.float64)
+    if 'SPY' in tickers:
+        market_returns = returns[:, tickers.index('SPY')]
+    else:
+        market_returns = returns.mean(axis=1)
+    
+    if portfolio_returns is None:
+        portfolio_returns = returns @ weights
+    
+    # beta = cov(port, mkt) / var(mkt) über zentrierte Skalarprodukte
+    pc = portfolio_returns - portfolio_returns.mean()
+    mc = market_returns - market_returns.mean()
+    market_ss = mc @ mc
+    return (pc @ mc) / market_ss if market_ss != 0 else np.nan
 
-def calculate_portfolio_variance(returns_df, weights):
+def calculate_portfolio_variance(returns, weights, cov_matrix=None):
     """Calculate portfolio variance"""
-    cov_matrix = returns_df.cov()
-    return np.dot(weights.T, np.dot(cov_matrix, weights))
+    if cov_matrix is None:
+        cov_matrix = np.atleast_2d(np.cov(np.asarray(returns, dtype=np.float64), rowvar=False))
+    return weights @ cov_matrix @ weights
 
-def calculate_diversification_ratio(returns_df, weights):
+def calculate_diversification_ratio(returns, weights, std_returns=None, portfolio_variance=None):
     """Calculate diversification ratio"""
-    weighted_vol = np.sum(weights * returns_df.std())
-    portfolio_vol = np.sqrt(calculate_portfolio_variance(returns_df, weights))
+    if std_returns is None:
+        std_returns = np.asarray(returns, dtype=np.float64).std(axis=0, ddof=1)
+    if portfolio_variance is None:
+        portfolio_variance = calculate_portfolio_variance(returns, weights)
+    weighted_vol = np.sum(weights * std_returns)
+    portfolio_vol = np.sqrt(portfolio_variance)
     return weighted_vol / portfolio_vol if portfolio_vol != 0 else np.nan
 
-def calculate_weight_contributions(returns_df, weights):
+def calculate_weight_contributions(returns, weights, mean_returns=None):
     """Calculate contribution of each asset to portfolio return"""
-    individual_returns = returns_df.mean() * 252
+    if mean_returns is None:
+        mean_returns = np.asarray(returns, dtype=np.float64).mean(axis=0)
+    individual_returns = mean_returns * 252
     return weights * individual_returns
 
-def calculate_risk_contributions(returns_df, weights):
+def calculate_risk_contributions(returns, weights, cov_matrix=None):
     """Calculate risk contribution of each asset"""
-    cov_matrix = returns_df.cov()
-    portfolio_vol = np.sqrt(calculate_portfolio_variance(returns_df, weights))
-    marginal_contributions = np.dot(cov_matrix, weights)
-    return (weights * marginal_contributions) / portfolio_vol if portfolio_vol != 0 else np.nan
+    if cov_matrix is None:
+        cov_matrix = np.atleast_2d(np.cov(np.asarray(returns, dtype=np.float64), rowvar=False))
+    return _variance_and_risk_contrib(cov_matrix, weights)[1]
+
+def _covariance(returns):
+    """Sample covariance (ddof=1) of a (T, N) return matrix; on the GPU for large N if cupy is installed"""
+    if cp is not None and returns.shape[1] >= GPU_MIN_ASSETS:
+        try:
+            return cp.asnumpy(cp.cov(cp.asarray(returns), rowvar=False))
+        except cp.cuda.runtime.CUDARuntimeError:   # kein nutzbares Gerät -> CPU
+            pass
+    return np.atleast_2d(np.cov(returns, rowvar=False))
+
+def _variance_and_risk_contrib(cov_matrix, weights):
+    """Portfolio variance and risk contributions from a single Σw product"""
+    sigma_w = cov_matrix @ weights                              # Marginale Beiträge
+    portfolio_variance = weights @ sigma_w
+    portfolio_vol = np.sqrt(portfolio_variance)
+    risk_contrib = weights * sigma_w / portfolio_vol if portfolio_vol != 0 else np.nan
+    return portfolio_variance, risk_contrib
 
 def generate_analysis_report(analysis_results, tickers, weights):
     """Generate a comprehensive text report of the analysis"""
@@ -225,13 +350,10 @@ def plot_asset_allocation(analysis_results, tickers, weights):
                                       autopct='%1.1f%%', colors=colors, startangle=90)
     ax1.set_title('Asset Allocation by Category', fontweight='bold')
     
-    asset_types = {}
-    for i, ticker in enumerate(tickers):
-        asset_info = analysis_results['allocation']['Asset Details'][ticker]
-        asset_type = asset_info['type']
-        if asset_type not in asset_types:
-            asset_types[asset_type] = 0
-        asset_types[asset_type] += weights[i]
+    asset_details = analysis_results['allocation']['Asset Details']
+    asset_types = defaultdict(float)
+    for ticker, weight in zip(tickers, weights):
+        asset_types[asset_details[ticker]['type']] += weight
     
     ax2.bar(asset_types.keys(), asset_types.values(), color=colors[:len(asset_types)])
     ax2.set_title('Asset Allocation by Type', fontweight='bold')
@@ -1,6 +1,14 @@
+import numpy as np
 import pandas as pd
 
 def build_portfolio_series(data, tickers, weights):
+    # Schneller Pfad: gemeinsamer Index -> eine Matrix und ein BLAS-Matrix-Vektor-Produkt
+    index = data[tickers[0]].index
+    if all(data[t].index.equals(index) for t in tickers[1:]):
+        mat = np.column_stack([data[t]["Close"].to_numpy(dtype=np.float64) for t in tickers])
+        mask = ~np.isnan(mat).any(axis=1)
+        return pd.Series(mat[mask] @ np.asarray(weights, dtype=np.float64), index=index[mask])
+
     closes = []
 
     for t in tickers:
@@ -13,3 +21,42 @@ def build_portfolio_series(data, tickers, weights):
     portfolio = df.dot(weights)
 
     return portfolio
+
+
+def build_price_matrix(data, tickers):
+    """
+    Close prices of all tickers as one DataFrame (columns = tickers).
+    If all tickers share the same date index, the columns are stacked directly
+    into one NumPy buffer; otherwise pandas aligns them via concat.
+    """
+    index = data[tickers[0]].index
+    if all(data[t].index.equals(index) for t in tickers[1:]):
+        prices = np.column_stack([data[t]["Close"].to_numpy() for t in tickers])
+        return pd.DataFrame(prices, index=index, columns=tickers)
+
+    price_df = pd.concat([data[t]["Close"] for t in tickers], axis=1)
+    price_df.columns = tickers
+    return price_df
+
+
+def build_return_matrix(data, tickers):
+    """
+    Daily simple returns of all tickers as (dates, float64 array (T, N)).
+    Each ticker's returns are computed on its own trading calendar (e.g. a Monday
+    return spans Friday -> Monday) and only then aligned on the common dates,
+    so gaps from other calendars do not drop neighbouring returns.
+    """
+    index = data[tickers[0]].index
+    if all(data[t].index.equals(index) for t in tickers[1:]):
+        closes = np.column_stack([data[t]["Close"].to_numpy(dtype=np.float64) for t in tickers])
+        if not np.isnan(closes).any():
+            return index[1:], closes[1:] / closes[:-1] - 1.0
+
+    returns = []
+    for t in tickers:
+        close = data[t]["Close"].dropna()
+        values = close.to_numpy(dtype=np.float64)
+        returns.append(pd.Series(values[1:] / values[:-1] - 1.0, index=close.index[1:]))
+
+    returns_df = pd.concat(returns, axis=1, join="inner")      # nur Tage, an denen alle Ticker eine Rendite haben
+    return returns_df.index, np.ascontiguousarray(returns_df.to_numpy(dtype=np.float64))
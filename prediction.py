@@ -3,6 +3,11 @@ import pandas as pd
 import matplotlib.pyplot as plt
 from sklearn.ensemble import RandomForestRegressor
 
+try:
+    from numba import njit
+except ImportError:   # numba ist optional
+    njit = None
+
 
 ##### Hilfsfunktionen
 
@@ -17,21 +22,64 @@ def create_features(series):
     df["roll_mean_20"] = df["return"].rolling(20).mean() #20-Tage gleitender Durchschnitt
     df["roll_std_20"] = df["return"].rolling(20).std() #20-Tage Votalität
 
-    df["momentum_10"] = series / series.shift(10) #Preis/Preis vor 10 Tagen
-    df["momentum_20"] = series / series.shift(20) #Preis/Preis vor 20 Tagen
+    # Momentum direkt auf dem Array (kein Index-Abgleich wie bei shift)
+    prices = series.to_numpy(dtype=np.float64)
+    momentum_10 = np.full(len(prices), np.nan)
+    momentum_10[10:] = prices[10:] / prices[:-10]
+    momentum_20 = np.full(len(prices), np.nan)
+    momentum_20[20:] = prices[20:] / prices[:-20]
+    df["momentum_10"] = momentum_10 #Preis/Preis vor 10 Tagen
+    df["momentum_20"] = momentum_20 #Preis/Preis vor 20 Tagen
 
     df = df.dropna()
     return df
 
 
+# Anzahl Preise, die für eine Feature-Zeile nötig sind (momentum_20 + 20-Tage-Fenster)
+_HISTORY = 21
+
+def _feature_row(prices, returns, i, out):
+    """
+    Features von create_features für Tag i direkt aus den Puffern
+    (gleiche Reihenfolge wie die Spalten, ohne "price")
+    """
+    out[0] = returns[i]
+
+    mean5 = 0.0
+    for j in range(i - 4, i + 1):
+        mean5 += returns[j]
+    mean5 /= 5
+    var5 = 0.0
+    for j in range(i - 4, i + 1):
+        var5 += (returns[j] - mean5) ** 2
+    out[1] = mean5                                  # roll_mean_5
+    out[2] = np.sqrt(var5 / 4)                      # roll_std_5 (ddof=1 wie pandas)
+
+    mean20 = 0.0
+    for j in range(i - 19, i + 1):
+        mean20 += returns[j]
+    mean20 /= 20
+    var20 = 0.0
+    for j in range(i - 19, i + 1):
+        var20 += (returns[j] - mean20) ** 2
+    out[3] = mean20                                 # roll_mean_20
+    out[4] = np.sqrt(var20 / 19)                    # roll_std_20
+
+    out[5] = prices[i] / prices[i - 10]             # momentum_10
+    out[6] = prices[i] / prices[i - 20]             # momentum_20
+
+if njit is not None:
+    _feature_row = njit(cache=True)(_feature_row)
+
+
 ##### Dataset erstellen
 
 def make_dataset(series):
     df = create_features(series)
 
-    X = df.drop(columns=["price"]).values
-    y = df["return"].shift(-1).dropna().values
-    X = X[:-1]
+    # Ziel = Rendite des Folgetags: gleiche Matrix, um eine Zeile versetzt (Views, keine Kopien)
+    X = df.drop(columns=["price"]).values[:-1]
+    y = df["return"].values[1:]
 
     return X, y, df.index[:-1]
 
@@ -46,10 +94,15 @@ def train_model(series):
     model = RandomForestRegressor(
         n_estimators=400,
         max_depth=12,
+        min_samples_leaf=5,   # kleinere Bäume: schnelleres Training und predict
+        n_jobs=-1,            # alle Kerne fürs Training
         random_state=42
     )
 
     model.fit(X[:split], y[:split])
+    # predict läuft in forecast_future_days tageweise auf 5 Zeilen: dort kostet der
+    # joblib-Thread-Start mehr als er bringt
+    model.set_params(n_jobs=1)
 
     X_test = X[split:]
     y_test = y[split:]
@@ -63,8 +116,6 @@ def forecast_future_days(model, series, years, noise_factor=1.0):
     days = years * 365
     n_simulations = 5
 
-    all_paths = []
-
     historical_returns = series.pct_change().dropna()
     historical_vol = historical_returns.std()
 
@@ -72,55 +123,48 @@ def forecast_future_days(model, series, years, noise_factor=1.0):
 
     crash_probability = 1 / (3 * 365)
 
-    for _ in range(n_simulations):
-        df = create_features(series)
-        last_row = df.iloc[-1].copy()
-        last_price = series.values[-1]
-
-        predicted_prices = []
-
-        for _ in range(days):
-            X = last_row.drop(labels="price").values.reshape(1, -1)
-
-            model_signal = model.predict(X)[0]
-            predicted_return = 0.1 * model_signal + target_drift
-
-            predicted_return += np.random.normal(
-                0,
-                last_row["roll_std_20"]
-                if not np.isnan(last_row["roll_std_20"])
-                else historical_vol
-            )
-
-            if np.random.rand() < crash_probability:
-                predicted_return -= np.random.uniform(0.12, 0.25)
-
-            predicted_return = np.clip(predicted_return, -0.35, 0.20)
-
-            last_price *= (1 + predicted_return)
-            predicted_prices.append(last_price)
-
-            new_row = {
-                "price": last_price,
-                "return": predicted_return,
-            }
-
-            df.loc[df.index[-1] + pd.Timedelta(days=1)] = new_row
-
-            df["roll_mean_5"] = df["return"].rolling(5).mean()
-            df["roll_std_5"] = df["return"].rolling(5).std()
-            df["roll_mean_20"] = df["return"].rolling(20).mean()
-            df["roll_std_20"] = df["return"].rolling(20).std()
-
-            df["momentum_10"] = df["price"] / df["price"].shift(10)
-            df["momentum_20"] = df["price"] / df["price"].shift(20)
-
-            df = df.tail(300)
-            last_row = df.iloc[-1]
-
-        all_paths.append(predicted_prices)
-
-    all_paths = np.array(all_paths)
+    # Nur die letzten Kurse werden für die Features gebraucht
+    history = series.values[-_HISTORY:].astype(np.float64)
+    if history.size < _HISTORY:
+        raise ValueError(f"forecast needs at least {_HISTORY} prices")
+
+    # Vorab allozierte Puffer statt wachsendem DataFrame mit rolling() pro Tag;
+    # alle Simulationen laufen im Gleichschritt (eine Zeile pro Simulation)
+    prices = np.empty((n_simulations, _HISTORY + days))
+    returns = np.empty((n_simulations, _HISTORY + days))
+    prices[:, :_HISTORY] = history
+    returns[:, 0] = np.nan
+    returns[:, 1:_HISTORY] = history[1:] / history[:-1] - 1
+
+    i = _HISTORY - 1
+    X = np.empty((n_simulations, 7))
+    for k in range(n_simulations):
+        _feature_row(prices[k], returns[k], i, X[k])
+
+    for _ in range(days):
+        # Ein predict-Aufruf für alle Simulationen statt einem pro Pfad und Tag
+        model_signal = model.predict(X)
+        predicted_return = 0.1 * model_signal + target_drift
+
+        roll_std_20 = X[:, 4]
+        predicted_return += np.random.normal(
+            0,
+            np.where(np.isnan(roll_std_20), historical_vol, roll_std_20)
+        )
+
+        crash = np.random.rand(n_simulations) < crash_probability
+        predicted_return[crash] -= np.random.uniform(0.12, 0.25, crash.sum())
+
+        predicted_return = np.clip(predicted_return, -0.35, 0.20)
+
+        # Neuen Tag anhängen und nur dessen Features neu berechnen
+        i += 1
+        prices[:, i] = prices[:, i - 1] * (1 + predicted_return)
+        returns[:, i] = predicted_return
+        for k in range(n_simulations):
+            _feature_row(prices[k], returns[k], i, X[k])
+
+    all_paths = prices[:, _HISTORY:]
     avg_path = all_paths.mean(axis=0)
 
     return avg_path.tolist()
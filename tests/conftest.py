@@ -0,0 +1,5 @@
+# Projektmodule liegen flach im Repository-Wurzelverzeichnis
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
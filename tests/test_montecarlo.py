@@ -0,0 +1,45 @@
+import pytest
+
+pytest.importorskip("numba")   # testet ausdrücklich den kompilierten Kernel
+
+import numpy as np
+import montecarlo
+
+
+def test_warmup_compiles_kernel():
+    montecarlo.warmup_gbm_kernel(3)
+
+
+def test_numba_kernel_antithetic_pairs():
+    # Ein Asset, keine Drift, S0 = 1: Partnerpfade haben negierte Log-Schocks,
+    # ihr Produkt ist daher in jedem Schritt 1
+    n_steps, n_sims = 5, 8
+    S0 = np.ones(1, dtype=np.float32)
+    L = np.full((1, 1), 0.01, dtype=np.float32)
+    drift = np.zeros(1, dtype=np.float32)
+    weights = np.ones(1, dtype=np.float32)
+    port = np.empty((n_steps + 1, n_sims), dtype=np.float32)
+    out = np.empty((n_steps + 1, n_sims, 1), dtype=np.float32)
+
+    montecarlo._gbm_kernel(S0, L, drift, weights, n_steps, n_sims, 42, port, out, True, True)
+
+    half = n_sims // 2
+    np.testing.assert_allclose(port[1:, :half] * port[1:, half:], 1.0, rtol=1e-4)
+    np.testing.assert_allclose(out[1:, :, 0], port[1:], rtol=1e-6)
+    assert not np.allclose(port[1:, 0], 1.0)
+
+
+def test_simulate_paths_cpu_numba_path():
+    S0 = np.array([100.0, 50.0])
+    L = np.linalg.cholesky(np.array([[1e-4, 5e-5], [5e-5, 2e-4]]))
+    drift = np.array([1e-4, 2e-4])
+    weights = np.array([0.5, 0.5], dtype=np.float32)
+    rng = np.random.default_rng(0)
+
+    port, assets = montecarlo._simulate_paths_cpu(S0, L, drift, weights, 10, 6, 7, rng,
+                                                  keep_asset_paths=True, antithetic=True)
+
+    assert port.shape == (11, 6)
+    assert assets.shape == (11, 6, 2)
+    assert np.isfinite(port).all()
+    np.testing.assert_allclose(port, assets @ weights, rtol=1e-5)
@@ -1,7 +1,12 @@
 import matplotlib.pyplot as plt
+import matplotlib.dates as mdates
 import numpy as np
 import pandas as pd
+from matplotlib.collections import LineCollection
 from matplotlib.gridspec import GridSpec
+from matplotlib.lines import Line2D
+from matplotlib.patches import Patch
+from portfolio_builder import build_price_matrix, build_return_matrix
 
 # def plot_prices(data):
 #     plt.figure(figsize=(12, 6))
@@ -15,34 +20,128 @@ from matplotlib.gridspec import GridSpec
 #     plt.tight_layout()
 #     plt.show()
 
-def plot_prediction(y_test, pred):
-    plt.figure(figsize=(12, 6))
-    plt.plot(y_test, label="Echt")
-    plt.plot(pred, label="Vorhersage")
-    plt.legend()
-    plt.title("ML-Vorhersage")
-    plt.xlabel("Zeit")
-    plt.ylabel("Portfoliowert")
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.show()
+# Offene Figuren der plot_*-Funktionen: bei erneutem Aufruf werden nur die Daten ersetzt
+_fig_cache = {}
 
-def plot_scenario(scenario):
-    plt.figure(figsize=(12, 6))
-    for t, df in scenario.items():
-        plt.plot(df["Close"], label=f"{t} (Szenario)")
-    plt.legend()
-    plt.title("Simuliertes Marktszenario")
-    plt.xlabel("Datum")
-    plt.ylabel("Preis ($)")
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.show()
+def _cached_figure(key):
+    """Cached (fig, ax, artists...) tuple if its window is still open, else None"""
+    cached = _fig_cache.get(key)
+    if cached is not None and plt.fignum_exists(cached[0].number):
+        return cached
+    _fig_cache.pop(key, None)
+    return None
+
+# Gemeinsame Figur für Vorhersage, Szenario und Drawdown (eine Achse pro Funktion)
+_dashboard = None
+
+def get_dashboard_fig():
+    """Shared (fig, axes) with three stacked axes; pass axes[i] as `ax` to the plot_* functions, then plt.show()"""
+    global _dashboard
+    if _dashboard is None or not plt.fignum_exists(_dashboard[0].number):
+        _dashboard = plt.subplots(3, 1, figsize=(12, 18))
+    return _dashboard
+
+def _target_axes(ax, figsize=(12, 6)):
+    """New figure if ax is None, else the cleared given axes (artists are created anew)"""
+    if ax is None:
+        return plt.subplots(figsize=figsize)
+    ax.clear()
+    return ax.figure, ax
+
+def _finish(fig, standalone, cache_key=None, artists=()):
+    """Standalone: layout once, remember the artists and show; shared axes: just redraw"""
+    if standalone:
+        fig.tight_layout()
+        _fig_cache[cache_key] = (fig, *artists)
+        plt.show()
+    else:
+        fig.canvas.draw_idle()
+
+def _refresh(fig, ax):
+    ax.relim()
+    ax.autoscale_view()
+    fig.canvas.draw_idle()
+
+def _line_collection(ax, segments, labels):
+    """All lines as one LineCollection (a single artist) plus one legend handle per line"""
+    cycle = plt.rcParams['axes.prop_cycle'].by_key()['color']
+    colors = [cycle[i % len(cycle)] for i in range(len(segments))]
+    lc = LineCollection(segments, colors=colors, linewidths=1.5)
+    ax.add_collection(lc)
+    ax.autoscale_view()
+    handles = [Line2D([], [], color=c, linewidth=1.5, label=label) for c, label in zip(colors, labels)]
+    return lc, handles
+
+def _column_segments(x, y):
+    """(T,) x values and (T, N) matrix -> N (T, 2) line segments"""
+    return [np.column_stack((x, y[:, i])) for i in range(y.shape[1])]
+
+def plot_prediction(y_test, pred, update=True, ax=None):
+    standalone = ax is None
+    cached = _cached_figure("prediction") if update and standalone else None
+    if cached is not None:
+        fig, ax, ln_true, ln_pred = cached
+        ln_true.set_data(np.arange(len(y_test)), y_test)
+        ln_pred.set_data(np.arange(len(pred)), pred)
+        _refresh(fig, ax)
+        plt.show()
+        return
+
+    fig, ax = _target_axes(ax)
+    ln_true, = ax.plot(y_test, label="Echt")
+    ln_pred, = ax.plot(pred, label="Vorhersage")
+    ax.legend()
+    ax.set_title("ML-Vorhersage")
+    ax.set_xlabel("Zeit")
+    ax.set_ylabel("Portfoliowert")
+    ax.grid(True, alpha=0.3)
+    _finish(fig, standalone, "prediction", (ax, ln_true, ln_pred))
+
+def plot_scenario(scenario, update=True, ax=None):
+    # Wiederverwendung nur, wenn dieselben Ticker gezeichnet werden
+    standalone = ax is None
+    key = ("scenario", tuple(scenario))
+    cached = _cached_figure(key) if update and standalone else None
+    # Eine Linie pro Ticker, jede mit ihrem eigenen Datumsindex
+    segments = [np.column_stack((mdates.date2num(df.index.to_pydatetime()),
+                                 df["Close"].to_numpy(dtype=np.float64)))
+                for df in scenario.values()]
+    if cached is not None:
+        fig, ax, lc = cached
+        lc.set_segments(segments)
+        # relim() kennt keine Collections: Datenbereich direkt aus den Segmenten
+        ax.ignore_existing_data_limits = True
+        ax.update_datalim(np.concatenate(segments))
+        ax.autoscale_view()
+        fig.canvas.draw_idle()
+        plt.show()
+        return
+
+    fig, ax = _target_axes(ax)
+    # Alle Ticker als eine LineCollection statt einer Line2D pro Ticker
+    lc, handles = _line_collection(ax, segments, [f"{t} (Szenario)" for t in scenario])
+    ax.xaxis_date()
+    ax.legend(handles=handles)
+    ax.set_title("Simuliertes Marktszenario")
+    ax.set_xlabel("Datum")
+    ax.set_ylabel("Preis ($)")
+    ax.grid(True, alpha=0.3)
+    _finish(fig, standalone, key, (ax, lc))
 
 def plot_portfolio_analysis(analysis_results, tickers, weights):
+    # Im interaktiven Modus würde fast jeder Artist ein Zwischen-Neuzeichnen anstossen;
+    # deshalb alles bei ausgeschaltetem interaktivem Modus aufbauen und einmal zeichnen
+    with plt.ioff():
+        fig = _build_portfolio_figure(analysis_results, tickers, weights)
+    fig.canvas.draw_idle()
+    plt.show()
+
+def _build_portfolio_figure(analysis_results, tickers, weights):
     
     fig = plt.figure(figsize=(16, 12))
-    gs = GridSpec(3, 3, figure=fig)
+    # Feste Ränder/Abstände statt tight_layout: kein Layout-Solver bei jedem Neuzeichnen
+    gs = GridSpec(3, 3, figure=fig, left=0.06, right=0.97, bottom=0.06, top=0.94,
+                  wspace=0.30, hspace=0.35)
     
     # 1. Portfolio Composition
     ax1 = fig.add_subplot(gs[0, 0])
@@ -53,19 +152,24 @@ def plot_portfolio_analysis(analysis_results, tickers, weights):
     
     # 2. Risk-Return Scatter
     ax2 = fig.add_subplot(gs[0, 1])
-    individual_returns = analysis_results['components']['Individual Returns']
-    individual_volatilities = analysis_results['components']['Individual Volatilities']
-    
-    for i, ticker in enumerate(tickers):
-        ax2.scatter(individual_volatilities[ticker], individual_returns[ticker], 
-                   s=100, alpha=0.7, label=ticker, color=colors[i])
-        ax2.annotate(ticker, (individual_volatilities[ticker], individual_returns[ticker]),
+    # Einmal als Arrays in Ticker-Reihenfolge statt Series[ticker]-Zugriffe pro Punkt
+    components = analysis_results['components']
+    ret_arr = np.array([components['Individual Returns'][t] for t in tickers])
+    vol_arr = np.array([components['Individual Volatilities'][t] for t in tickers])
+    
+    # Alle Assets als eine PathCollection; Legendeneinträge als Platzhalter-Marker
+    ax2.scatter(vol_arr, ret_arr, s=100, alpha=0.7, color=colors)
+    asset_handles = [Line2D([], [], marker='o', linestyle='', markersize=10, alpha=0.7,
+                            color=colors[i], label=ticker)
+                     for i, ticker in enumerate(tickers)]
+    for ticker, vol, ret in zip(tickers, vol_arr, ret_arr):
+        ax2.annotate(ticker, (vol, ret),
                     xytext=(5, 5), textcoords='offset points', fontsize=9)
     
     port_return = analysis_results['basic_stats']['Annualized Return']
     port_vol = analysis_results['basic_stats']['Annualized Volatility']
-    ax2.scatter(port_vol, port_return, s=200, marker='*', color='red', 
-               label='Portfolio', edgecolors='black')
+    port_marker = ax2.scatter(port_vol, port_return, s=200, marker='*', color='red', 
+                              label='Portfolio', edgecolors='black')
     ax2.annotate('Portfolio', (port_vol, port_return), xytext=(10, 10),
                 textcoords='offset points', fontweight='bold', color='red')
     
@@ -73,7 +177,7 @@ def plot_portfolio_analysis(analysis_results, tickers, weights):
     ax2.set_ylabel('Annualized Return')
     ax2.set_title('Risk-Return Profile', fontweight='bold')
     ax2.grid(True, alpha=0.3)
-    ax2.legend()
+    ax2.legend(handles=asset_handles + [port_marker])
     
     # 3. Performance Metrics
     ax3 = fig.add_subplot(gs[0, 2])
@@ -92,7 +196,9 @@ def plot_portfolio_analysis(analysis_results, tickers, weights):
                 f'{value:.2f}', ha='center', va='bottom')
     
     # 4. Risk Metrics
-    ax4 = fig.add_subplot(gs[1, 0])
+    # Mittlere Zeile mit mehr Abstand: rechts neben der Heatmap sitzt die Farbskala samt Beschriftung
+    gs_mid = gs[1, :].subgridspec(1, 3, wspace=0.45)
+    ax4 = fig.add_subplot(gs_mid[0])
     risk_metrics = ['Max Drawdown', 'VaR (95%)', 'CVaR (95%)']
     risk_values = [
         analysis_results['risk_metrics']['Max Drawdown'],
@@ -111,54 +217,73 @@ def plot_portfolio_analysis(analysis_results, tickers, weights):
                 f'{value:.2%}', ha='center', va='bottom')
     
     # 5. Correlation Heatmap
-    ax5 = fig.add_subplot(gs[1, 1])
+    ax5 = fig.add_subplot(gs_mid[1])
     corr_matrix = analysis_results['diversification']['Correlation Matrix']
-    im = ax5.imshow(corr_matrix, cmap='coolwarm', vmin=-1, vmax=1, aspect='auto')
+    # Einmal nach float32 (C-contiguous) konvertieren; dient auch für die Beschriftung
+    corr_values = np.ascontiguousarray(corr_matrix, dtype=np.float32)
+    im = ax5.imshow(corr_values, cmap='coolwarm', vmin=-1, vmax=1, aspect='auto',
+                    interpolation='nearest')
+    im.set_rasterized(True)                                     # bei Vektor-Export als Bitmap einbetten
     
     ax5.set_xticks(range(len(tickers)))
     ax5.set_yticks(range(len(tickers)))
     ax5.set_xticklabels(tickers, rotation=45)
     ax5.set_yticklabels(tickers)
     
-
-    for i in range(len(tickers)):
-        for j in range(len(tickers)):
-            ax5.text(j, i, f'{corr_matrix.iloc[i, j]:.2f}', 
-                    ha='center', va='center', fontsize=8,
-                    color='white' if abs(corr_matrix.iloc[i, j]) > 0.5 else 'black')
+    # Alle Zellwerte als eine transparente Tabelle über dem Bild (ein Artist statt N² Texte);
+    # bbox = ganze Achse passt zu den imshow-Zellen, da aspect='auto'
+    n = len(corr_values)
+    text_colors = np.where(np.abs(corr_values) > 0.5, 'white', 'black')
+    tbl = ax5.table(cellText=[[f'{v:.2f}' for v in row] for row in corr_values],
+                    cellColours=[[(0, 0, 0, 0)] * n for _ in range(n)],
+                    cellLoc='center', bbox=[0, 0, 1, 1])
+    tbl.auto_set_font_size(False)
+    tbl.set_fontsize(8)
+    for (i, j), cell in tbl.get_celld().items():
+        cell.set_edgecolor('none')
+        cell.get_text().set_color(text_colors[i, j])
     
     ax5.set_title('Correlation Matrix', fontweight='bold')
-    plt.colorbar(im, ax=ax5)
+    # Farbskala in eigener Achse direkt rechts neben ax5: ax5 wird nicht verkleinert,
+    # Tabelle und Bild behalten ihre Geometrie
+    cax = ax5.inset_axes([1.02, 0.0, 0.03, 1.0])
+    fig.colorbar(im, cax=cax)
     
     # 6. Return Contribution vs Risk Contribution
-    ax6 = fig.add_subplot(gs[1, 2])
+    ax6 = fig.add_subplot(gs_mid[2])
     return_contrib = analysis_results['components']['Weight Contribution']
     risk_contrib = analysis_results['components']['Risk Contribution']
     
     x = np.arange(len(tickers))
     width = 0.35
     
-    ax6.bar(x - width/2, return_contrib, width, label='Return Contribution', alpha=0.7, color='lightblue')
-    ax6.bar(x + width/2, risk_contrib, width, label='Risk Contribution', alpha=0.7, color='lightcoral')
+    # Beide Balkengruppen in einem bar()-Aufruf; Legende über Platzhalter-Patches
+    n = len(x)
+    ax6.bar(np.concatenate((x - width/2, x + width/2)),
+            np.concatenate((np.asarray(return_contrib), np.asarray(risk_contrib))),
+            width, alpha=0.7, color=['lightblue'] * n + ['lightcoral'] * n)
+    contrib_handles = [Patch(color='lightblue', alpha=0.7, label='Return Contribution'),
+                       Patch(color='lightcoral', alpha=0.7, label='Risk Contribution')]
     
     ax6.set_xlabel('Assets')
     ax6.set_ylabel('Contribution')
     ax6.set_title('Return vs Risk Contribution', fontweight='bold')
     ax6.set_xticks(x)
     ax6.set_xticklabels(tickers, rotation=45)
-    ax6.legend()
+    ax6.legend(handles=contrib_handles)
     ax6.grid(True, alpha=0.3, axis='y')
     
     # 7. Statistical Distribution Analysis
     ax7 = fig.add_subplot(gs[2, :])
     
 
-    sample_returns = np.random.normal(analysis_results['basic_stats']['Annualized Return'], 
-                                     analysis_results['basic_stats']['Annualized Volatility'], 
-                                     1000)
+    # Normalverteilung analytisch statt Histogramm aus Zufallsstichproben
+    mu = analysis_results['basic_stats']['Annualized Return']
+    sigma = analysis_results['basic_stats']['Annualized Volatility']
+    x = np.linspace(mu - 4 * sigma, mu + 4 * sigma, 200)
+    pdf = np.exp(-0.5 * ((x - mu) / sigma) ** 2) / (sigma * np.sqrt(2 * np.pi))
     
-    ax7.hist(sample_returns, bins=50, density=True, alpha=0.7, color='lightgray', 
-             label='Return Distribution')
+    ax7.fill_between(x, pdf, alpha=0.7, color='lightgray', label='Return Distribution')
     
     ax7.axvline(analysis_results['basic_stats']['Annualized Return'], 
                 color='red', linestyle='--', linewidth=2, label='Mean Return')
@@ -178,8 +303,7 @@ def plot_portfolio_analysis(analysis_results, tickers, weights):
     ax7.text(0.02, 0.98, stats_text, transform=ax7.transAxes, verticalalignment='top',
             bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
     
-    plt.tight_layout()
-    plt.show()
+    return fig
 
 # def plot_returns_over_time(data, weights):
 #     plt.figure(figsize=(12, 8))
@@ -213,103 +337,178 @@ def plot_portfolio_analysis(analysis_results, tickers, weights):
 #     plt.tight_layout()
 #     plt.show()
 
-def plot_drawdown(data, weights):
-    plt.figure(figsize=(12, 6))
-    
-    all_returns = []
-    for df in data.values():
-        ret = df["Close"].pct_change().dropna()
-        all_returns.append(ret)
-    
-    returns_df = pd.concat(all_returns, axis=1)
-    returns_df.columns = data.keys()
-    portfolio_returns = returns_df.dot(weights)
+def _minmax_decimate(x, y, target):
+    """
+    Reduce a long series to about `target` points for plotting.
+    Each bucket keeps its minimum and maximum (in time order), so the visible envelope is unchanged.
+    y can be (T,) or (T, N) with one column per line; NaNs are ignored within a bucket.
+    """
+    n_buckets = target // 2
+    if len(x) <= target or n_buckets < 1:
+        return x, y
+
+    size = len(x) // n_buckets
+    cut = size * n_buckets
+    yb = y[:cut].reshape(n_buckets, size, *y.shape[1:])
+    lo = np.fmin.reduce(yb, axis=1)
+    hi = np.fmax.reduce(yb, axis=1)
+    rising = yb[:, -1] >= yb[:, 0]                              # steigend: erst Minimum, dann Maximum
+
+    xb = x[:cut].reshape(n_buckets, size)
+    x_dec = np.column_stack((xb[:, 0], xb[:, -1])).ravel()
+    y_dec = np.stack((np.where(rising, lo, hi), np.where(rising, hi, lo)), axis=1)
+    y_dec = y_dec.reshape(2 * n_buckets, *y.shape[1:])
+    # Rest, der keinen vollen Bucket füllt, unverändert anhängen
+    return np.concatenate((x_dec, x[cut:])), np.concatenate((y_dec, y[cut:]))
+
+def _decimation_target(fig):
+    """About two points per horizontal pixel of the figure"""
+    return 2 * int(fig.get_figwidth() * fig.dpi)
+
+def plot_drawdown(data, weights, update=True, ax=None):
+    dates, returns = build_return_matrix(data, list(data.keys()))
+    if len(dates) == 0:
+        print("No common trading days - drawdown cannot be plotted.")
+        return
+    portfolio_returns = returns @ np.asarray(weights, dtype=np.float64)
     
     # Calculate drawdown
-    cumulative_returns = (1 + portfolio_returns).cumprod()
-    running_max = cumulative_returns.expanding().max()
-    drawdown = (cumulative_returns - running_max) / running_max
-    
-    plt.fill_between(drawdown.index, drawdown.values, 0, alpha=0.3, color='red')
-    plt.plot(drawdown.index, drawdown.values, color='red', linewidth=1)
-    plt.title('Portfolio Drawdown Over Time', fontweight='bold')
-    plt.xlabel('Date')
-    plt.ylabel('Drawdown')
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.show()
+    cumulative_returns = np.cumprod(1 + portfolio_returns)
+    running_max = np.maximum.accumulate(cumulative_returns)
+    drawdown = ((cumulative_returns - running_max) / running_max).astype(np.float32)   # nur zur Anzeige
+    
+    x = mdates.date2num(dates.to_pydatetime())                  # Datumsumrechnung einmal für beide Artists
+    
+    standalone = ax is None
+    cached = _cached_figure("drawdown") if update and standalone else None
+    if cached is not None:
+        fig, ax, fill, line = cached
+        x, drawdown = _minmax_decimate(x, drawdown, _decimation_target(fig))
+        fill.remove()                                           # Fläche lässt sich nicht per set_data ändern
+        fill = ax.fill_between(x, drawdown, 0, alpha=0.3, color='red')
+        line.set_data(x, drawdown)
+        _fig_cache["drawdown"] = (fig, ax, fill, line)
+        _refresh(fig, ax)
+        plt.show()
+        return
+    
+    fig, ax = _target_axes(ax)
+    x, drawdown = _minmax_decimate(x, drawdown, _decimation_target(fig))
+    fill = ax.fill_between(x, drawdown, 0, alpha=0.3, color='red')
+    line, = ax.plot(x, drawdown, color='red', linewidth=1)
+    ax.xaxis_date()
+    ax.set_title('Portfolio Drawdown Over Time', fontweight='bold')
+    ax.set_xlabel('Date')
+    ax.set_ylabel('Drawdown')
+    ax.grid(True, alpha=0.3)
+    _finish(fig, standalone, "drawdown", (ax, fill, line))
 
 def interactive_toggle_plot(data, weights=None):
 
     fig, ax = plt.subplots(figsize=(12, 6))
+    # Zweite Achse an derselben Stelle: beide Ansichten werden einmal gezeichnet,
+    # beim Umschalten wird nur die Sichtbarkeit getauscht
+    ax_ret = fig.add_axes(ax.get_position(), label="returns")
+    ax_ret.set_visible(False)
     mode = "price"
 
-    price_df = pd.concat([df["Close"] for df in data.values()], axis=1)
-    price_df.columns = data.keys()
+    price_df = build_price_matrix(data, list(data.keys()))
 
-    returns_df = price_df.pct_change().dropna()
+    # Renditen je Ticker auf dem eigenen Kalender, dann auf gemeinsame Tage ausgerichtet
+    return_dates, returns = build_return_matrix(data, list(data.keys()))
+    # Kumulierte Renditen einmal für alle Spalten gemeinsam
+    cum_returns = np.cumprod(1.0 + returns, axis=0) - 1.0
 
     if weights is not None:
-        weights = np.array(weights)
+        weights = np.asarray(weights, dtype=np.float64)
 
-        # portfolio_price[t] = sum_i( weight_i * price_i[t] )
-        portfolio_price = price_df.mul(weights, axis=1).sum(axis=1)
+        # portfolio_price[t] = sum_i( weight_i * price_i[t] ), fehlende Kurse zählen als 0
+        portfolio_price = pd.Series(np.nan_to_num(price_df.to_numpy(dtype=np.float64)) @ weights,
+                                    index=price_df.index)
 
-        portfolio_returns = returns_df.dot(weights)
+        portfolio_returns = returns @ weights
+        cum_port = pd.Series(np.cumprod(1.0 + portfolio_returns) - 1.0, index=return_dates)
 
-    def plot_price():
-        ax.clear()
+    # Nur zur Anzeige: y-Werte als float32 (halbe Datenmenge für die Pfade);
+    # die Datumszahlen bleiben float64, sonst gehen die Tage verloren
+    price_arr = price_df.to_numpy(dtype=np.float32)
+    cum_arr = cum_returns.astype(np.float32)
 
-        for ticker in price_df.columns:
-            ax.plot(price_df.index, price_df[ticker], label=ticker)
+    # Datumsachsen einmal in Matplotlib-Zahlen umrechnen statt in jedem plot()-Aufruf
+    x_price = mdates.date2num(price_df.index.to_pydatetime())
+    x_return = mdates.date2num(return_dates.to_pydatetime())
+    # Lange Reihen auf ~2 Punkte pro Pixel reduzieren (Min/Max je Bucket bleibt sichtbar)
+    target = _decimation_target(fig)
+
+    def plot_price():
+        # Alle Ticker als eine LineCollection; nur die Portfolio-Linie als eigenes Line2D
+        _, handles = _line_collection(ax, _column_segments(*_minmax_decimate(x_price, price_arr, target)),
+                                      price_df.columns)
 
         if weights is not None:
-            ax.plot(portfolio_price.index,
-                    portfolio_price.values,
-                    label="Portfolio",
-                    color="black",
-                    linewidth=3)
+            handles += ax.plot(*_minmax_decimate(x_price, portfolio_price.to_numpy(dtype=np.float32), target),
+                               label="Portfolio",
+                               color="black",
+                               linewidth=3)
 
+        ax.xaxis_date()
         ax.set_title("Historical Prices (Real, Not Normalized)")
         ax.set_xlabel("Date")
         ax.set_ylabel("Price [$]")
         ax.grid(True, alpha=0.3)
-        ax.legend()
-        fig.canvas.draw_idle()
+        ax.legend(handles=handles)
 
     def plot_return():
-        ax.clear()
-
-        for ticker in returns_df.columns:
-            cum = (1 + returns_df[ticker]).cumprod() - 1
-            ax.plot(cum.index, cum.values, label=ticker)
+        _, handles = _line_collection(ax_ret, _column_segments(*_minmax_decimate(x_return, cum_arr, target)),
+                                      price_df.columns)
 
         if weights is not None:
-            cum_port = (1 + portfolio_returns).cumprod() - 1
-            ax.plot(cum_port.index,
-                    cum_port.values,
-                    label="Portfolio",
-                    color="black",
-                    linewidth=3)
-
-        ax.set_title("Cumulative Returns Over Time")
-        ax.set_xlabel("Date")
-        ax.set_ylabel("Cumulative Return [%]")
-        ax.grid(True, alpha=0.3)
-        ax.legend()
-        fig.canvas.draw_idle()
+            handles += ax_ret.plot(*_minmax_decimate(x_return, cum_port.to_numpy(dtype=np.float32), target),
+                                   label="Portfolio",
+                                   color="black",
+                                   linewidth=3)
+
+        ax_ret.xaxis_date()
+        ax_ret.set_title("Cumulative Returns Over Time")
+        ax_ret.set_xlabel("Date")
+        ax_ret.set_ylabel("Cumulative Return [%]")
+        ax_ret.grid(True, alpha=0.3)
+        ax_ret.legend(handles=handles)
 
     plot_price()
+    plot_return()
 
-    def on_key(event):
+    # Blitting: fertig gerenderte Ansichten als Pixel-Puffer merken
+    backgrounds = {}
+
+    def on_draw(event):
+        backgrounds[mode] = fig.canvas.copy_from_bbox(fig.bbox)
+
+    def on_resize(event):
+        backgrounds.clear()                             # Puffer passen nicht mehr zur Fenstergrösse
+
+    def show(new_mode):
         nonlocal mode
+        if new_mode == mode:
+            return
+        mode = new_mode
+        ax.set_visible(mode == "price")
+        ax_ret.set_visible(mode == "return")
+
+        if fig.canvas.supports_blit and mode in backgrounds:
+            fig.canvas.restore_region(backgrounds[mode])
+            fig.canvas.blit(fig.bbox)
+        else:
+            fig.canvas.draw_idle()                      # Erstes Mal: voll zeichnen, on_draw merkt sich das Bild
+
+    def on_key(event):
         if event.key == "h":
-            mode = "price"
-            plot_price()
+            show("price")
         elif event.key == "r":
-            mode = "return"
-            plot_return()
+            show("return")
 
+    fig.canvas.mpl_connect("draw_event", on_draw)
+    fig.canvas.mpl_connect("resize_event", on_resize)
     fig.canvas.mpl_connect("key_press_event", on_key)
 
     print("\nInteractive Plot Controls:")